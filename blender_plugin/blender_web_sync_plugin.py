@@ -1,12 +1,97 @@
 import bpy
 import json
+import numpy as np
+import os
+import select
 import socket
+import struct
 import threading
 import time
 import zlib
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import count
 from datetime import datetime
 from bpy.app.handlers import persistent
 
+# Payload codec tags, sent as the 5th header byte so the server knows how to inflate
+CODEC_NONE = 0
+CODEC_ZLIB = 1
+CODEC_ZSTD = 2
+
+# Pick the fastest available compressor per codec once at import time. Scene payloads
+# compress about as well at level 1 as at level 6, so favour speed.
+try:
+    import deflate  # libdeflate bindings, zlib-compatible output
+
+    def _zlib_compress(data):
+        return deflate.zlib_compress(data, 3)
+except ImportError:
+    try:
+        from isal import isal_zlib  # Intel ISA-L, zlib-compatible output
+
+        def _zlib_compress(data):
+            return isal_zlib.compress(data, 1)
+    except ImportError:
+        def _zlib_compress(data):
+            return zlib.compress(data, 1)
+
+COMPRESSORS = {CODEC_ZLIB: _zlib_compress}
+try:
+    import zstandard
+
+    # Faster than zlib level 1 with a better ratio, but only if the server can inflate it
+    COMPRESSORS[CODEC_ZSTD] = zstandard.ZstdCompressor(level=1).compress
+except ImportError:
+    pass
+
+# Best first; the server lists what it can inflate when Blender connects
+CODEC_PREFERENCE = (CODEC_ZSTD, CODEC_ZLIB)
+
+# Content hash for texture caching: xxh3 or BLAKE3 when installed, MD5 otherwise
+try:
+    from xxhash import xxh3_128 as _content_hasher
+except ImportError:
+    try:
+        from blake3 import blake3 as _content_hasher
+    except ImportError:
+        from hashlib import md5 as _content_hasher
+
+# 64-bit payload fingerprint to detect unchanged scenes without keeping the last payload
+try:
+    from xxhash import xxh3_64_intdigest as _payload_hash
+except ImportError:
+    from hashlib import blake2b
+
+    def _payload_hash(data):
+        return int.from_bytes(blake2b(data, digest_size=8).digest(), "big")
+
+# JSON codec: orjson (bytes in/out, SIMD parser) when installed, stdlib json otherwise.
+# Mesh data stays in numpy arrays up to this point; orjson serialises them natively.
+def _json_default(obj):
+    """Convert numpy values the encoder can't handle natively"""
+    if isinstance(obj, (np.ndarray, np.generic)):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+try:
+    import orjson
+
+    _json_loads = orjson.loads  # Accepts bytes/bytearray/memoryview directly
+
+    def _json_dumps(obj):
+        # Non-contiguous arrays fall back to _json_default
+        return orjson.dumps(obj, default=_json_default, option=orjson.OPT_SERIALIZE_NUMPY)
+except ImportError:
+    def _json_loads(data):
+        if isinstance(data, memoryview):
+            data = str(data, 'utf-8')
+        return json.loads(data)
+
+    def _json_dumps(obj):
+        return json.dumps(obj, default=_json_default).encode('utf-8')
+
 bl_info = {
     "name": "Web Sync",
     "author": "Ma3h1r0",
@@ -20,12 +105,21 @@ bl_info = {
 # Global variables
 tcp_socket = None
 is_server_running = False
-last_data = None
-last_frame_sync_time = 0
+last_data_hash = 0  # _payload_hash of the last sent payload, 0 forces a send
+payload_codec = CODEC_ZLIB  # every server inflates zlib; upgraded by the server's codec list
 last_depsgraph_sync_time = 0
-frame_sync_throttle = 0.016  # ~60 FPS max (16ms between updates)
+pending_sync = False  # Depsgraph updates arrived inside the throttle window; the drain timer sends the latest state
 receive_thread = None
 stop_receive_thread = False
+receive_buffer = bytearray(1 << 20)  # Reused for every received message, grown on demand
+send_thread = None
+send_thread_stop = threading.Event()  # stop signal of the current sender; every sender gets its own
+
+# Latest (scene_data, texture blobs) waiting for the sender thread to encode and send;
+# newer scenes overwrite it (last wins)
+pending_payload = None
+pending_payload_lock = threading.Lock()
+payload_ready = threading.Event()
 
 # Track received transform data for UI display
 received_transform_data = {
@@ -38,13 +132,76 @@ received_transform_data = {
     "total_received": 0
 }
 
+# Binary transform batch from the server (JSON messages start with '{' or '[').
+# Layout: [1 byte type][2 bytes record count, LE] + records of name, timestamp ms, 9 floats
+MESSAGE_TRANSFORM_BATCH = 0x01
+TRANSFORM_RECORD = struct.Struct("<64sQ9f")
+
+# Incoming transforms waiting for the main thread; only the latest per object is kept
+pending_transforms = {}  # objectName -> transform_update message
+pending_transforms_lock = threading.Lock()
+transform_drain_scheduled = False
+
 # Anti-feedback protection
 is_applying_external_transform = False
 external_transform_cooldown_end = 0
 last_applied_transform = None
-
-# Texture cache to avoid re-encoding unchanged textures
-texture_cache = {}  # filepath -> {"hash": str, "data": str, "size": int, "format": str}
+external_transform_flag_clear_at = 0  # when clear_external_transform_flag may drop the flag
+
+# Content-addressed texture cache to avoid re-reading and re-sending unchanged textures
+texture_probe_keys = {}  # "path|size|mtime" or "packed:name:size" -> content hash
+texture_cache = {}  # hash -> {"name": str, "hash": str, "size": int, "format": str, "mime": str}
+texture_blobs = OrderedDict()  # hash -> raw image bytes in LRU order, sent in the binary section
+texture_blobs_size = 0  # total bytes held in texture_blobs
+TEXTURE_CACHE_MAX_BYTES = 256 * 1024 * 1024  # evict least recently used textures beyond this
+sent_texture_hashes = set()  # hashes the web clients already hold; reset on (re)connect
+pinned_texture_hashes = set()  # hashes the scene being extracted references; never evicted mid-pass
+file_stat_cache = {}  # image path -> (checked_at, "path|size|mtime") from the last stat()
+FILE_STAT_TTL = 0.25  # seconds a stat() result is trusted
+MATERIAL_RECHECK_INTERVAL = 2.0  # seconds a material untouched by depsgraph updates skips its node walk
+image_pointer_cache = {}  # image.as_pointer() -> source state and content hash from the last sync
+material_cache = {}  # material.as_pointer() -> {"node": Principled BSDF name, "signature": tuple, "data": dict}
+material_verified = {}  # material.as_pointer() -> time its cache entry was last confirmed current
+
+# Principled BSDF inputs read by extract_material_data, with the socket names used across
+# Blender versions (4.0 renamed several); resolved to socket indices once per session
+PRINCIPLED_INPUT_NAMES = {
+    "Base Color": ("Base Color",),
+    "Roughness": ("Roughness",),
+    "Metallic": ("Metallic",),
+    "Normal": ("Normal",),
+    "Emission": ("Emission Color", "Emission"),
+    "Emission Strength": ("Emission Strength",),
+    "Transmission": ("Transmission Weight", "Transmission"),
+    "Alpha": ("Alpha",),
+    "IOR": ("IOR",),
+    "Clearcoat": ("Coat Weight", "Clearcoat"),
+    "Clearcoat Roughness": ("Coat Roughness", "Clearcoat Roughness"),
+}
+PRINCIPLED_IDX = {}  # input name from PRINCIPLED_INPUT_NAMES -> socket index
+
+# Extracted mesh arrays per object, reused until depsgraph reports a geometry update
+object_geometry_cache = {}  # obj.as_pointer() -> {"version", "vertices", "faces", "uvs"}
+geometry_dirty = set()  # as_pointer() of objects/meshes with geometry updates since the last sync
+geometry_versions = count(1)  # source of geometryVersion numbers sent to the web clients
+sent_geometry_versions = {}  # object name -> geometryVersion the web clients hold; reset on (re)connect
+mesh_pack_pool = None  # ThreadPoolExecutor running pack_mesh_arrays, see get_mesh_pack_pool
+# Bumped per object only when its world matrix changes, so clients can skip re-applying it
+object_transform_epochs = {}  # obj.as_pointer() -> (matrix bytes, transformEpoch)
+transform_epochs = count(1)  # shared source, so a replaced object never repeats an epoch
+
+# Last extracted lights and world, rebuilt only after a depsgraph update may have changed them
+lights_cache = None
+world_cache = None
+lights_dirty = True
+world_dirty = True
+
+# Logging: messages below LOG_LEVEL are dropped before any formatting work.
+# Hot paths also check DEBUG_LOGGING before building their f-strings.
+LOG_LEVELS = {"DEBUG": 10, "INFO": 20, "WARNING": 30, "ERROR": 40}
+DEBUG_LOGGING = False
+LOG_LEVEL = LOG_LEVELS["DEBUG"] if DEBUG_LOGGING else LOG_LEVELS["INFO"]
+log_timestamp_cache = (None, "")  # (epoch second, formatted "YYYY-mm-dd HH:MM:SS")
 
 sync_stats = {
     "start_time": None,
@@ -55,26 +212,69 @@ sync_stats = {
     "errors": 0,
     "textures_cached": 0,
     "textures_sent": 0,
+    "coalesced": 0,
+    "texture_cache_bytes": 0,
 }
 
 
 def log_message(message, level="INFO"):
-    """Log message with timestamp"""
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
-    print(f"[{timestamp}] [{level}] WebSync: {message}")
+    """Log message with timestamp, skipping messages below LOG_LEVEL"""
+    global log_timestamp_cache
+    if LOG_LEVELS.get(level, LOG_LEVEL) < LOG_LEVEL:
+        return
+
+    # Only format the date/time part once per second; milliseconds are appended
+    now = time.time()
+    second = int(now)
+    if log_timestamp_cache[0] != second:
+        log_timestamp_cache = (second, time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(second)))
+    print(f"[{log_timestamp_cache[1]}.{int(now * 1000) % 1000:03d}] [{level}] WebSync: {message}")
 
 
 def clear_external_transform_flag():
     """Clear the external transform application flag"""
     global is_applying_external_transform
+    # Transforms that arrived after this timer was registered push the deadline out
+    remaining = external_transform_flag_clear_at - time.time()
+    if remaining > 0:
+        return remaining
     is_applying_external_transform = False
     log_message("🔓 External transform application complete, ready for normal sync")
     return None  # Don't reschedule
 
 
-def apply_transform_update(transform_data):
+def queue_transform_update(message):
+    """Collect a transform update for the main thread, replacing any older one for the same object"""
+    global transform_drain_scheduled
+    with pending_transforms_lock:
+        object_name = message.get("objectName", "")
+        # Re-insert so the batch is applied in order of the latest update
+        pending_transforms.pop(object_name, None)
+        pending_transforms[object_name] = message
+        if transform_drain_scheduled:
+            return
+        transform_drain_scheduled = True
+    bpy.app.timers.register(apply_pending_transforms, first_interval=0.001)
+
+
+def apply_pending_transforms():
+    """Timer function: apply every collected transform update, then refresh the view layer once"""
+    global transform_drain_scheduled
+    with pending_transforms_lock:
+        batch = list(pending_transforms.values())
+        pending_transforms.clear()
+        transform_drain_scheduled = False
+
+    for message in batch:
+        apply_transform_update(message, update_view_layer=False)
+    if batch:
+        bpy.context.view_layer.update()
+    return None  # Don't reschedule
+
+
+def apply_transform_update(transform_data, update_view_layer=True):
     """Apply transform update to Blender object with anti-feedback protection"""
-    global received_transform_data, is_applying_external_transform, external_transform_cooldown_end, last_applied_transform
+    global is_applying_external_transform, external_transform_cooldown_end, last_applied_transform, external_transform_flag_clear_at
     
     try:
         object_name = transform_data.get("objectName", "")
@@ -82,30 +282,31 @@ def apply_transform_update(transform_data):
         rotation = transform_data.get("rotation", [0, 0, 0])
         scale = transform_data.get("scale", [1, 1, 1])
         timestamp = transform_data.get("timestamp", "")
+        now = time.time()
         
-        # Update received data tracking for UI display
-        received_transform_data.update({
-            "last_received": time.time(),
-            "object_name": object_name,
-            "position": position.copy(),
-            "rotation": rotation.copy(),
-            "scale": scale.copy(),
-            "timestamp": datetime.fromtimestamp(timestamp / 1000).strftime("%H:%M:%S.%f")[:-3] if timestamp else "",
-            "total_received": received_transform_data["total_received"] + 1
-        })
+        # Update received data tracking for UI display in place. The lists come
+        # fresh from the JSON decoder, and the raw timestamp is only formatted
+        # when the panel draws.
+        received_transform_data["last_received"] = now
+        received_transform_data["object_name"] = object_name
+        received_transform_data["position"][:] = position
+        received_transform_data["rotation"][:] = rotation
+        received_transform_data["scale"][:] = scale
+        received_transform_data["timestamp"] = timestamp
+        received_transform_data["total_received"] += 1
         
         log_message(f"Applying external transform to '{object_name}': pos={position}, rot={rotation}, scale={scale}")
         
         # Set protection flags to prevent feedback
         is_applying_external_transform = True
-        external_transform_cooldown_end = time.time() + 1.0  # 1 second cooldown
+        external_transform_cooldown_end = now + 1.0  # 1 second cooldown
         
         # Store the applied transform to avoid re-processing
         last_applied_transform = {
             "object_name": object_name,
-            "position": position.copy(),
-            "rotation": rotation.copy(),
-            "scale": scale.copy(),
+            "position": position,
+            "rotation": rotation,
+            "scale": scale,
             "timestamp": timestamp
         }
         
@@ -124,14 +325,17 @@ def apply_transform_update(transform_data):
             obj.rotation_euler = rotation
             obj.scale = scale
             
-            # Update the scene
-            bpy.context.view_layer.update()
+            # Update the scene (batched callers update once for the whole batch)
+            if update_view_layer:
+                bpy.context.view_layer.update()
             log_message(f"✅ External transform applied to '{object_name}' (anti-feedback protection active)")
         else:
             log_message(f"❌ Object '{object_name}' not found in scene", "WARNING")
         
-        # Schedule flag clearing after a brief moment
-        bpy.app.timers.register(clear_external_transform_flag, first_interval=0.1)
+        # Schedule flag clearing after a brief moment, reusing a pending timer if there is one
+        external_transform_flag_clear_at = now + 0.1
+        if not bpy.app.timers.is_registered(clear_external_transform_flag):
+            bpy.app.timers.register(clear_external_transform_flag, first_interval=0.1)
             
     except Exception as e:
         # Reset protection flag on error
@@ -139,79 +343,143 @@ def apply_transform_update(transform_data):
         log_message(f"Error applying transform: {str(e)}", "ERROR")
 
 
+def handle_resync_request():
+    """Resend the full scene, including texture blobs, to newly connected clients"""
+    global last_data_hash
+    sent_texture_hashes.clear()
+    sent_geometry_versions.clear()
+    last_data_hash = 0
+    send_mesh_data()
+    return None  # Don't reschedule
+
+
+def wait_readable(sock, timeout=1.0):
+    """Wait until the socket has data, so the receive thread can poll its stop flag"""
+    readable, _, _ = select.select([sock], [], [], timeout)
+    return bool(readable)
+
+
+def decode_transform_batch(view):
+    """Unpack a binary transform batch into transform_update messages"""
+    record_count = int.from_bytes(view[1:3], "little")
+    records = view[3:3 + record_count * TRANSFORM_RECORD.size]
+    if len(records) != record_count * TRANSFORM_RECORD.size:
+        raise ValueError(f"Truncated transform batch: {len(records)} bytes for {record_count} records")
+
+    messages = []
+    for name, timestamp, *values in TRANSFORM_RECORD.iter_unpack(records):
+        messages.append({
+            "type": "transform_update",
+            "objectName": name.rstrip(b"\0").decode("utf-8"),
+            "position": values[0:3],
+            "rotation": values[3:6],
+            "scale": values[6:9],
+            "timestamp": timestamp,
+        })
+    return messages
+
+
+def select_payload_codec(server_codecs):
+    """Use the best codec both this Blender and the server support"""
+    global payload_codec
+    for codec in CODEC_PREFERENCE:
+        if codec in server_codecs and codec in COMPRESSORS:
+            payload_codec = codec
+            break
+    log_message(f"Payload codec: {payload_codec} (server supports {list(server_codecs)})")
+
+
+def dispatch_message(message):
+    """Route one decoded server message to the main thread"""
+    if message.get('type') == 'transform_update':
+        # Collected and applied in the main thread by a single timer
+        queue_transform_update(message)
+        log_message(f"🔄 Transform update queued for object: {message.get('objectName', 'unknown')}")
+    elif message.get('type') == 'hello':
+        select_payload_codec(message.get('codecs', ()))
+    elif message.get('type') == 'resync_request':
+        # A new web client connected and needs the full scene, textures included
+        bpy.app.timers.register(handle_resync_request, first_interval=0.001)
+        log_message("🔁 Full resync requested by server")
+
+
 def receive_messages():
     """Thread function to receive messages from server with robust error handling"""
-    global tcp_socket, stop_receive_thread
+    global tcp_socket, stop_receive_thread, receive_buffer
     
     log_message("Receive thread started")
-    
+
+    size_data = bytearray(4)
+    size_view = memoryview(size_data)
+
     while not stop_receive_thread and tcp_socket:
         try:
-            # Receive message size (4 bytes) with proper handling
-            size_data = b""
-            while len(size_data) < 4 and not stop_receive_thread:
+            # Receive message size (4 bytes) straight into a fixed header buffer
+            header_received = 0
+            while header_received < 4 and not stop_receive_thread:
                 try:
-                    chunk = tcp_socket.recv(4 - len(size_data))
-                    if not chunk:
+                    if not wait_readable(tcp_socket):
+                        continue
+                    got = tcp_socket.recv_into(size_view[header_received:])
+                    if not got:
                         log_message("Connection closed by server", "WARNING")
                         return
-                    size_data += chunk
-                except socket.timeout:
-                    continue
+                    header_received += got
                 except Exception as e:
                     log_message(f"Error receiving header: {str(e)}", "ERROR")
                     return
-            
-            if len(size_data) < 4:
+
+            if header_received < 4:
                 continue
-                
+
             message_size = int.from_bytes(size_data, byteorder="big")
-            
+
             # Validate message size
             if message_size > 10 * 1024 * 1024:  # 10MB max for received messages
                 log_message(f"Received message too large: {message_size} bytes", "ERROR")
                 continue
-            
-            log_message(f"📦 Expecting message: {message_size} bytes", "DEBUG")
-            
-            # Receive the actual message in chunks
-            message_data = b""
-            while len(message_data) < message_size and not stop_receive_thread:
-                remaining = message_size - len(message_data)
-                chunk_size = min(remaining, 64 * 1024)  # 64KB chunks
-                
+
+            if DEBUG_LOGGING:
+                log_message(f"📦 Expecting message: {message_size} bytes", "DEBUG")
+
+            # Receive the actual message into the reusable buffer (no per-chunk copies)
+            if len(receive_buffer) < message_size:
+                receive_buffer = bytearray(message_size)
+            message_view = memoryview(receive_buffer)[:message_size]
+            received = 0
+            while received < message_size and not stop_receive_thread:
                 try:
-                    chunk = tcp_socket.recv(chunk_size)
-                    if not chunk:
+                    if not wait_readable(tcp_socket):
+                        continue
+                    got = tcp_socket.recv_into(message_view[received:], message_size - received)
+                    if not got:
                         log_message("Connection closed during message receive", "WARNING")
                         return
-                    message_data += chunk
-                    log_message(f"📥 Received chunk: {len(chunk)} bytes ({len(message_data)}/{message_size})", "DEBUG")
-                except socket.timeout:
-                    continue
+                    received += got
                 except Exception as e:
                     log_message(f"Error receiving message data: {str(e)}", "ERROR")
                     return
-            
-            if len(message_data) == message_size:
+
+            if received == message_size:
                 try:
-                    message_str = message_data.decode('utf-8')
-                    message = json.loads(message_str)
-                    log_message(f"📨 Received complete message: {message.get('type', 'unknown')} ({len(message_data)} bytes)")
-                    
-                    if message.get('type') == 'transform_update':
-                        # Queue the transform update to be applied in the main thread
-                        bpy.app.timers.register(lambda msg=message: apply_transform_update(msg), first_interval=0.001)
-                        log_message(f"🔄 Transform update queued for object: {message.get('objectName', 'unknown')}")
+                    if message_size and message_view[0] == MESSAGE_TRANSFORM_BATCH:
+                        # Fast path: fixed-layout transform records, no JSON parsing
+                        messages = decode_transform_batch(message_view)
+                    else:
+                        message = _json_loads(message_view)
+                        # The server batches buffered transform updates into one JSON array
+                        messages = message if isinstance(message, list) else (message,)
+                    log_message(f"📨 Received complete message: {len(messages)} item(s) ({message_size} bytes)")
+                    for message in messages:
+                        dispatch_message(message)
                         
-                except (json.JSONDecodeError, UnicodeDecodeError) as e:
+                except (json.JSONDecodeError, UnicodeDecodeError, ValueError) as e:
                     log_message(f"Error parsing received message: {str(e)}", "ERROR")
-                    log_message(f"Message preview: {message_data[:100]}...", "DEBUG")
+                    if DEBUG_LOGGING:
+                        log_message(f"Message preview: {message_view[:100].tobytes()}...", "DEBUG")
             else:
-                log_message(f"Incomplete message received: {len(message_data)}/{message_size} bytes", "ERROR")
+                log_message(f"Incomplete message received: {received}/{message_size} bytes", "ERROR")
                     
-        except socket.timeout:
-            continue
         except Exception as e:
             if not stop_receive_thread:
                 log_message(f"Critical error in receive thread: {str(e)}", "ERROR")
@@ -222,22 +490,78 @@ def receive_messages():
 
 def calculate_fast_hash(data):
     """Calculate a fast hash of binary data for caching"""
-    import hashlib
-    # Use MD5 for speed (not security), or just check file size + modification time
-    hasher = hashlib.md5()
-    hasher.update(data)
-    return hasher.hexdigest()
+    # Only called on a cache miss; hits are resolved by the file/packed cache key
+    return _content_hasher(data).hexdigest()
 
 
 def get_file_cache_key(image_path):
     """Get cache key based on filepath and modification time"""
-    import os
+    # Reuse a recent stat() result; every textured socket asks for this on every sync
+    now = time.monotonic()
+    cached = file_stat_cache.get(image_path)
+    if cached and now - cached[0] < FILE_STAT_TTL:
+        return cached[1]
+
     try:
         stat = os.stat(image_path)
         # Use filepath + size + modification time as cache key
-        return f"{image_path}|{stat.st_size}|{int(stat.st_mtime)}"
-    except:
-        return image_path
+        cache_key = f"{image_path}|{stat.st_size}|{stat.st_mtime_ns}"
+    except OSError:
+        cache_key = image_path
+
+    file_stat_cache[image_path] = (now, cache_key)
+    return cache_key
+
+
+def lookup_image_pointer(image):
+    """Return the cached content hash for an Image datablock if its source is unchanged"""
+    entry = image_pointer_cache.get(image.as_pointer())
+    if entry is None or image.is_dirty or image.filepath != entry["filepath"]:
+        return None
+
+    if image.packed_file:
+        # Re-packing allocates a new PackedFile, so its pointer changes even at the same size
+        if (image.packed_file.as_pointer(), image.packed_file.size) != entry["packed"]:
+            return None
+        return entry["hash"]
+    if entry["packed"] is not None:
+        return None  # image was unpacked since the last sync
+
+    # External file: re-check size and modification time at most every FILE_STAT_TTL.
+    # Any difference counts, since copies and checkouts can carry an older mtime.
+    now = time.monotonic()
+    if now - entry["checked_at"] >= FILE_STAT_TTL:
+        try:
+            stat = os.stat(entry["path"])
+        except OSError:
+            return None
+        if (stat.st_size, stat.st_mtime_ns) != entry["stat"]:
+            return None
+        entry["checked_at"] = now
+    return entry["hash"]
+
+
+def remember_image_pointer(image, image_path, texture_hash):
+    """Record an Image datablock's source state so the next sync can skip the probe"""
+    packed = None
+    file_stat = None
+    if image.packed_file:
+        packed = (image.packed_file.as_pointer(), image.packed_file.size)
+    else:
+        try:
+            stat = os.stat(image_path)
+        except OSError:
+            return
+        file_stat = (stat.st_size, stat.st_mtime_ns)
+
+    image_pointer_cache[image.as_pointer()] = {
+        "hash": texture_hash,
+        "filepath": image.filepath,
+        "path": image_path,
+        "packed": packed,
+        "stat": file_stat,
+        "checked_at": time.monotonic(),
+    }
 
 
 def format_bytes(size):
@@ -292,9 +616,11 @@ def get_sync_stats():
         f"Data sent: {format_bytes(sync_stats['bytes_sent'])}\n"
         f"Sync rate: {sync_stats['sync_rate']:.2f} Hz\n"
         f"Errors: {sync_stats['errors']}\n"
+        f"Coalesced: {sync_stats.get('coalesced', 0)}\n"
         f"Textures cached: {textures_cached}\n"
         f"Textures sent: {textures_sent}\n"
-        f"Cache hit rate: {cache_hit_rate:.1f}%"
+        f"Cache hit rate: {cache_hit_rate:.1f}%\n"
+        f"Texture cache: {format_bytes(sync_stats.get('texture_cache_bytes', 0))}"
     )
 
 
@@ -317,31 +643,245 @@ def get_received_data_info():
     pos = received_transform_data["position"]
     rot = received_transform_data["rotation"]
     scale = received_transform_data["scale"]
+    timestamp = received_transform_data["timestamp"]
+    time_label = datetime.fromtimestamp(timestamp / 1000).strftime("%H:%M:%S.%f")[:-3] if timestamp else ""
     
     return (
         f"Total received: {received_transform_data['total_received']}\n"
         f"Last update: {time_str}\n"
         f"Object: {received_transform_data['object_name']}\n"
-        f"Time: {received_transform_data['timestamp']}\n"
+        f"Time: {time_label}\n"
         f"Position: ({pos[0]:.3f}, {pos[1]:.3f}, {pos[2]:.3f})\n"
         f"Rotation: ({rot[0]:.3f}, {rot[1]:.3f}, {rot[2]:.3f})\n"
         f"Scale: ({scale[0]:.3f}, {scale[1]:.3f}, {scale[2]:.3f})"
     )
 
 
-def send_data(data_str):
+# Mesh arrays sent as raw little-endian buffers in the binary section: field -> wire dtype
+MESH_ARRAY_FIELDS = {"vertices": "<f4", "faces": "<u4", "uvs": "<f4"}
+MESH_DTYPE_NAMES = {"<f4": "float32", "<u4": "uint32"}
+
+
+def encode_scene_payload(scene_data, texture_data):
+    """Encode scene data as [4 bytes JSON length][JSON header][binary section]
+
+    Mesh arrays (vertices, faces, uvs) and the (N, 4, 4) "transforms" array holding each
+    object's world matrix are replaced in the header by descriptors
+    {"offset", "length", "dtype", "shape"} pointing at raw little-endian buffers in the
+    binary section. Objects whose geometryVersion the clients already hold carry
+    "reuseGeometry": true instead of the arrays. The header is padded so the section
+    starts 4-byte aligned and typed arrays can view it without copying. Texture bytes
+    follow, referenced by hash and indexed as "blobs": {hash: [offset, length]};
+    textures the clients already hold are sent by hash only. texture_data maps
+    hash -> bytes for the textures the scene references.
+    """
+    chunks = []
+    offset = 0
+
+    def add_array(array, dtype):
+        nonlocal offset
+        data = np.ascontiguousarray(array, dtype=dtype)
+        descriptor = {
+            "offset": offset,
+            "length": data.nbytes,
+            "dtype": MESH_DTYPE_NAMES[dtype],
+            "shape": data.shape,
+        }
+        chunks.append(data)
+        offset += data.nbytes
+        return descriptor
+
+    # Typed buffers first: 4-byte elements keep every offset aligned
+    header_data = dict(scene_data)
+    if isinstance(scene_data.get("transforms"), np.ndarray):
+        header_data["transforms"] = add_array(scene_data["transforms"], "<f4")
+
+    objects = []
+    for obj in scene_data.get("objects", ()):
+        encoded = dict(obj)
+        version = obj.get("geometryVersion")
+        if version is not None and sent_geometry_versions.get(obj["name"]) == version:
+            # Clients already hold this geometry: send a reference instead of the arrays
+            for field in MESH_ARRAY_FIELDS:
+                encoded.pop(field, None)
+            encoded["reuseGeometry"] = True
+            objects.append(encoded)
+            continue
+
+        for field, dtype in MESH_ARRAY_FIELDS.items():
+            array = obj.get(field)
+            if not isinstance(array, np.ndarray):
+                continue
+            encoded[field] = add_array(array, dtype)
+        if version is not None:
+            sent_geometry_versions[obj["name"]] = version
+        objects.append(encoded)
+
+    blob_index = {}
+    frame_hashes = set()
+    for obj in objects:
+        for material in obj.get("materials", ()):
+            for texture in material.get("textures", {}).values():
+                texture_hash = texture.get("hash")
+                frame_hashes.add(texture_hash)
+                if texture_hash in sent_texture_hashes or texture_hash not in texture_data:
+                    continue
+                blob = texture_data[texture_hash]
+                blob_index[texture_hash] = [offset, len(blob)]
+                chunks.append(blob)
+                offset += len(blob)
+                sent_texture_hashes.add(texture_hash)
+    # Clients release textures a frame no longer references, so they must be sent again if reused
+    sent_texture_hashes.intersection_update(frame_hashes)
+
+    header_data["objects"] = objects
+    header_data["blobs"] = blob_index
+    header = _json_dumps(header_data)
+    # Trailing spaces are valid JSON and align the binary section to 4 bytes
+    header += b" " * (-(4 + len(header)) % 4)
+    # One join so multi-MB buffers are copied once, not once per concatenation
+    return b"".join([len(header).to_bytes(4, byteorder="big"), header, *chunks])
+
+
+def create_sync_socket(port):
+    """Create and connect the TCP socket used to talk to the sync server"""
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    # Small transform/header frames must not wait on Nagle; large scenes need deep buffers
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 4 * 1024 * 1024)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 4 * 1024 * 1024)
+    sock.settimeout(5.0)
+    sock.connect(("localhost", port))
+    # Blocking once connected so sendall can't time out mid-frame; the receive
+    # thread polls with select() instead to notice stop requests
+    sock.settimeout(None)
+    return sock
+
+
+def collect_texture_blobs(scene_data):
+    """Snapshot the texture bytes a scene references, so the sender thread never reads texture_blobs"""
+    blobs = {}
+    for obj in scene_data.get("objects", ()):
+        for material in obj.get("materials", ()):
+            for texture in material.get("textures", {}).values():
+                texture_hash = texture.get("hash")
+                if texture_hash in texture_blobs:
+                    blobs[texture_hash] = texture_blobs[texture_hash]
+    return blobs
+
+
+def send_data(scene_data):
+    """Hand a scene to the sender thread, replacing any scene it has not picked up yet"""
+    global pending_payload
+
+    # Extraction is done; encoding, hashing, compression and sending happen off the main thread
+    payload = (scene_data, collect_texture_blobs(scene_data))
+    with pending_payload_lock:
+        if pending_payload is not None:
+            # The newest scene supersedes the one still waiting to be sent
+            sync_stats["coalesced"] = sync_stats.get("coalesced", 0) + 1
+        pending_payload = payload
+    payload_ready.set()
+    return True
+
+
+def send_messages(sock, stop_event):
+    """Thread function to encode, compress and send the latest pending scene to the server"""
+    global pending_payload, last_data_hash
+
+    log_message("Send thread started")
+
+    while not stop_event.is_set():
+        if not payload_ready.wait(timeout=0.5):
+            continue
+        with pending_payload_lock:
+            payload = pending_payload
+            pending_payload = None
+            payload_ready.clear()
+        if stop_event.is_set():
+            break
+        if payload is None:
+            continue
+
+        try:
+            # Encode data as JSON header + binary mesh buffers and texture blobs
+            data_bytes = encode_scene_payload(*payload)
+        except Exception as e:
+            log_message(f"Failed to encode scene data: {str(e)}", "ERROR")
+            update_sync_stats(is_error=True)
+            continue
+
+        # Send if data is different from last time
+        data_hash = _payload_hash(data_bytes)
+        if data_hash == last_data_hash:
+            log_message("Scene data unchanged, skipping send")
+            continue
+        log_message(f"Preparing to send scene data with materials and lighting, size: {format_bytes(len(data_bytes))}")
+
+        if transmit_data(sock, data_bytes):
+            last_data_hash = data_hash
+            update_sync_stats(len(data_bytes))
+        else:
+            update_sync_stats(is_error=True)
+            # Clients may have missed texture blobs or geometry, send them again next time
+            sent_texture_hashes.clear()
+            sent_geometry_versions.clear()
+            # The payload never arrived, so an unchanged scene must not be skipped
+            last_data_hash = 0
+
+    log_message("Send thread stopped")
+
+
+def stop_sender(sock):
+    """Signal the send thread to exit and wait for it; False if it is still running"""
+    send_thread_stop.set()
+    payload_ready.set()
+    if sock:
+        # The socket blocks on send; shutting it down releases a sender stuck in sendall
+        try:
+            sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+    if send_thread and send_thread.is_alive():
+        send_thread.join(timeout=2.0)
+        if send_thread.is_alive():
+            log_message("Send thread did not stop in time", "WARNING")
+            return False
+    return True
+
+
+def send_frame(sock, header, payload):
+    """Write header and payload with one sendmsg() call, without concatenating them"""
+    if not hasattr(sock, "sendmsg"):
+        # Windows has no sendmsg(); a single sendall still avoids a split header segment
+        sock.sendall(header + payload)
+        return
+
+    total = len(header) + len(payload)
+    sent = sock.sendmsg([header, payload])
+    if sent == total:
+        return
+
+    # Partial write: finish the remainder from where the kernel stopped
+    if sent < len(header):
+        sock.sendall(header[sent:])
+        sent = len(header)
+    sock.sendall(memoryview(payload)[sent - len(header):])
+
+
+def transmit_data(sock, data_bytes):
     """Send data to TCP server with proper framing and error handling"""
     try:
-        global tcp_socket
-        if not tcp_socket:
+        if not sock:
             log_message("No TCP socket available", "ERROR")
             return False
 
-        # Encode and compress data
+        # Compress data; read the codec once so the tag always matches the payload
+        codec = payload_codec
         try:
-            data_bytes = data_str.encode('utf-8')
-            compressed_data = zlib.compress(data_bytes, level=6)  # Balanced compression
-            log_message(f"Compression: {len(data_bytes)} -> {len(compressed_data)} bytes ({(len(compressed_data)/len(data_bytes)*100):.1f}%)", "DEBUG")
+            compressed_data = COMPRESSORS[codec](data_bytes)
+            if DEBUG_LOGGING:
+                log_message(f"Compression: {len(data_bytes)} -> {len(compressed_data)} bytes ({(len(compressed_data)/len(data_bytes)*100):.1f}%)", "DEBUG")
         except Exception as e:
             log_message(f"Data compression failed: {str(e)}", "ERROR")
             return False
@@ -351,183 +891,194 @@ def send_data(data_str):
             log_message(f"Compressed data too large: {len(compressed_data)} bytes", "ERROR")
             return False
 
-        # Send data size header (4 bytes, big-endian)
+        # Header: data size (4 bytes, big-endian) followed by the codec tag (1 byte).
+        # Written together with the payload so small frames go out as one segment.
         size = len(compressed_data)
-        size_header = size.to_bytes(4, byteorder="big")
-        
+        header = size.to_bytes(4, byteorder="big") + bytes((codec,))
+
         try:
-            bytes_sent = tcp_socket.send(size_header)
-            if bytes_sent != 4:
-                log_message(f"Header send incomplete: {bytes_sent}/4 bytes", "ERROR")
-                return False
-            log_message(f"Sent header: {size} bytes expected", "DEBUG")
+            send_frame(sock, header, compressed_data)
         except Exception as e:
-            log_message(f"Failed to send header: {str(e)}", "ERROR")
+            log_message(f"Failed to send data: {str(e)}", "ERROR")
             return False
 
-        # Send compressed data in chunks to avoid partial sends
-        total_sent = 0
-        chunk_size = 64 * 1024  # 64KB chunks
-        
-        while total_sent < len(compressed_data):
-            chunk_end = min(total_sent + chunk_size, len(compressed_data))
-            chunk = compressed_data[total_sent:chunk_end]
-            
-            try:
-                bytes_sent = tcp_socket.send(chunk)
-                if bytes_sent == 0:
-                    log_message("Socket connection broken during send", "ERROR")
-                    return False
-                total_sent += bytes_sent
-                log_message(f"Sent chunk: {bytes_sent} bytes ({total_sent}/{len(compressed_data)})", "DEBUG")
-            except Exception as e:
-                log_message(f"Failed to send data chunk: {str(e)}", "ERROR")
-                return False
-
-        if total_sent != len(compressed_data):
-            log_message(f"Incomplete send: {total_sent}/{len(compressed_data)} bytes", "ERROR")
-            return False
-
-        log_message(f"Successfully sent {total_sent} compressed bytes", "DEBUG")
+        if DEBUG_LOGGING:
+            log_message(f"Successfully sent {len(header) + size} bytes", "DEBUG")
         return True
-        
+
     except Exception as e:
-        log_message(f"Critical error in send_data: {str(e)}", "ERROR")
+        log_message(f"Critical error in transmit_data: {str(e)}", "ERROR")
         return False
 
 
+def store_texture_blob(texture_hash, data):
+    """Add texture bytes to the LRU blob cache; eviction waits for evict_texture_blobs()"""
+    global texture_blobs_size
+
+    previous = texture_blobs.pop(texture_hash, None)
+    if previous is not None:
+        texture_blobs_size -= len(previous)
+    texture_blobs[texture_hash] = data
+    texture_blobs_size += len(data)
+    pinned_texture_hashes.add(texture_hash)
+    sync_stats["texture_cache_bytes"] = texture_blobs_size
+
+
+def texture_held(texture_hash):
+    """True if the texture's bytes are cached here or the web clients already hold them"""
+    return texture_hash in texture_blobs or texture_hash in sent_texture_hashes
+
+
+def touch_texture_blob(texture_hash):
+    """Mark a texture as used by the scene being extracted: most recent in the LRU, and pinned"""
+    if texture_hash in texture_blobs:
+        texture_blobs.move_to_end(texture_hash)
+    pinned_texture_hashes.add(texture_hash)
+
+
+def evict_texture_blobs():
+    """Drop least recently used blobs over the size limit, sparing those the last scene pinned
+
+    Runs once send_data() has snapshotted the scene's blobs, so a texture is never
+    evicted between being extracted and being queued for sending.
+    """
+    global texture_blobs_size
+
+    for texture_hash in list(texture_blobs):
+        if texture_blobs_size <= TEXTURE_CACHE_MAX_BYTES:
+            break
+        if texture_hash in pinned_texture_hashes:
+            continue
+        evicted = texture_blobs.pop(texture_hash)
+        texture_blobs_size -= len(evicted)
+        # texture_cache keeps the small metadata entry: clients holding the blob need nothing more
+        log_message(f"TEXTURE: Evicted '{texture_hash[:8]}...' from cache ({format_bytes(len(evicted))})")
+
+    pinned_texture_hashes.clear()
+    sync_stats["texture_cache_bytes"] = texture_blobs_size
+
+
 def extract_texture_data(socket):
-    """Extract texture data from a node socket with caching"""
+    """Extract texture data from a node socket with content-addressed caching"""
     global texture_cache, sync_stats
-    
+
     if socket.is_linked:
         linked_node = socket.links[0].from_node
         if linked_node.type == 'TEX_IMAGE' and linked_node.image:
             try:
                 image = linked_node.image
-                log_message(f"TEXTURE: Processing image '{image.name}'", "DEBUG")
-                
-                # Determine cache key and image source
-                cache_key = None
+                if DEBUG_LOGGING:
+                    log_message(f"TEXTURE: Processing image '{image.name}'", "DEBUG")
+
+                # Fast path: same Image datablock, unchanged source, no string keys or stat()
+                texture_hash = lookup_image_pointer(image)
                 image_data = None
-                
-                if image.packed_file:
-                    # Image is packed in .blend file - use image name + size as cache key
-                    cache_key = f"packed:{image.name}:{len(image.packed_file.data)}"
-                    
-                    # Check cache first
-                    if cache_key in texture_cache:
-                        cached_data = texture_cache[cache_key]
-                        log_message(f"TEXTURE: Using cached packed image '{image.name}' (hash: {cached_data.get('hash', 'unknown')[:8]}...)", "DEBUG")
-                        log_message(f"TEXTURE: Cached data type: {type(cached_data)}, keys: {list(cached_data.keys()) if isinstance(cached_data, dict) else 'not dict'}", "DEBUG")
-                        sync_stats["textures_cached"] = sync_stats.get("textures_cached", 0) + 1
-                        # Ensure we return a valid texture data structure
-                        if isinstance(cached_data, dict) and 'name' in cached_data and 'hash' in cached_data:
-                            log_message(f"TEXTURE: About to return cached texture_data: {cached_data}", "DEBUG")
-                            return cached_data
-                        else:
-                            log_message(f"TEXTURE: Invalid cached data structure, re-processing texture", "WARNING")
-                            log_message(f"TEXTURE: Invalid cached data was: {cached_data}", "DEBUG")
-                            # Remove invalid cache entry and continue to re-process
-                            del texture_cache[cache_key]
-                    
-                    log_message(f"TEXTURE: Image '{image.name}' is packed, extracting data", "DEBUG")
-                    image_data = image.packed_file.data[:]
-                    
-                elif image.filepath:
-                    # Image is external file
-                    import os
-                    
-                    # Get absolute path
-                    if image.filepath.startswith('//'):
-                        # Relative path in Blender
-                        blend_file = bpy.data.filepath
-                        if blend_file:
-                            blend_dir = os.path.dirname(blend_file)
-                            image_path = os.path.join(blend_dir, image.filepath[2:])
+
+                if texture_hash not in texture_cache or not texture_held(texture_hash):
+                    # Determine a cheap probe key (no content read) and image source
+                    probe_key = None
+                    image_path = None
+
+                    if image.packed_file:
+                        # Image is packed in .blend file - name, PackedFile identity and size as probe key
+                        packed_file = image.packed_file
+                        probe_key = f"packed:{image.name}:{packed_file.as_pointer()}:{packed_file.size}"
+
+                    elif image.filepath:
+                        # Image is external file
+                        # Get absolute path
+                        if image.filepath.startswith('//'):
+                            # Relative path in Blender
+                            blend_file = bpy.data.filepath
+                            if blend_file:
+                                blend_dir = os.path.dirname(blend_file)
+                                image_path = os.path.join(blend_dir, image.filepath[2:])
+                            else:
+                                log_message(f"TEXTURE: Cannot resolve relative path '{image.filepath}' - blend file not saved", "WARNING")
+                                return {"name": image.name, "filepath": image.filepath, "error": "relative_path_no_blend"}
                         else:
-                            log_message(f"TEXTURE: Cannot resolve relative path '{image.filepath}' - blend file not saved", "WARNING")
-                            return {"name": image.name, "filepath": image.filepath, "error": "relative_path_no_blend"}
+                            image_path = os.path.abspath(image.filepath)
+
+                        # Use file-based probe key (path + size + mtime)
+                        probe_key = get_file_cache_key(image_path)
                     else:
-                        image_path = os.path.abspath(image.filepath)
-                    
-                    # Use file-based cache key (path + size + mtime)
-                    cache_key = get_file_cache_key(image_path)
-                    
-                    # Check cache first
-                    if cache_key in texture_cache:
-                        cached_data = texture_cache[cache_key]
-                        log_message(f"TEXTURE: Using cached file '{image.name}' from '{image_path}' (hash: {cached_data.get('hash', 'unknown')[:8]}...)", "DEBUG")
-                        log_message(f"TEXTURE: Cached data type: {type(cached_data)}, keys: {list(cached_data.keys()) if isinstance(cached_data, dict) else 'not dict'}", "DEBUG")
-                        sync_stats["textures_cached"] = sync_stats.get("textures_cached", 0) + 1
-                        # Ensure we return a valid texture data structure
-                        if isinstance(cached_data, dict) and 'name' in cached_data and 'hash' in cached_data:
-                            log_message(f"TEXTURE: About to return cached texture_data: {cached_data}", "DEBUG")
-                            return cached_data
+                        log_message(f"TEXTURE: Image '{image.name}' has no file path", "WARNING")
+                        return {"name": image.name, "error": "no_filepath"}
+
+                    # Probe hit: content already known, no read or hash needed
+                    texture_hash = texture_probe_keys.get(probe_key)
+
+                    if texture_hash not in texture_cache or not texture_held(texture_hash):
+                        if image.packed_file:
+                            if DEBUG_LOGGING:
+                                log_message(f"TEXTURE: Image '{image.name}' is packed, extracting data", "DEBUG")
+                            image_data = image.packed_file.data[:]
                         else:
-                            log_message(f"TEXTURE: Invalid cached data structure, re-processing texture", "WARNING")
-                            log_message(f"TEXTURE: Invalid cached data was: {cached_data}", "DEBUG")
-                            # Remove invalid cache entry and continue to re-process
-                            del texture_cache[cache_key]
-                    
-                    log_message(f"TEXTURE: Reading external file '{image_path}' (not in cache)", "DEBUG")
-                    
-                    if os.path.exists(image_path):
-                        try:
-                            with open(image_path, 'rb') as f:
-                                image_data = f.read()
-                            log_message(f"TEXTURE: Successfully read {len(image_data)} bytes from '{image_path}'", "DEBUG")
-                        except Exception as e:
-                            log_message(f"TEXTURE: Failed to read file '{image_path}': {str(e)}", "ERROR")
-                            return {"name": image.name, "filepath": image.filepath, "error": str(e)}
-                    else:
-                        log_message(f"TEXTURE: File not found: '{image_path}'", "ERROR")
-                        return {"name": image.name, "filepath": image.filepath, "error": "file_not_found"}
+                            if DEBUG_LOGGING:
+                                log_message(f"TEXTURE: Reading external file '{image_path}' (not in cache)", "DEBUG")
+
+                            if not os.path.exists(image_path):
+                                log_message(f"TEXTURE: File not found: '{image_path}'", "ERROR")
+                                return {"name": image.name, "filepath": image.filepath, "error": "file_not_found"}
+                            try:
+                                with open(image_path, 'rb') as f:
+                                    image_data = f.read()
+                                if DEBUG_LOGGING:
+                                    log_message(f"TEXTURE: Successfully read {len(image_data)} bytes from '{image_path}'", "DEBUG")
+                            except Exception as e:
+                                log_message(f"TEXTURE: Failed to read file '{image_path}': {str(e)}", "ERROR")
+                                return {"name": image.name, "filepath": image.filepath, "error": str(e)}
+
+                        # Same content under another name/path resolves to the same entry
+                        texture_hash = calculate_fast_hash(image_data)
+                        texture_probe_keys[probe_key] = texture_hash
+
+                    remember_image_pointer(image, image_path, texture_hash)
+
+                # Probe hit, or probe miss with a known hash (renamed/repacked image)
+                cached_data = texture_cache.get(texture_hash)
+                if cached_data is not None and texture_held(texture_hash):
+                    if DEBUG_LOGGING:
+                        log_message(f"TEXTURE: Using cached image '{image.name}' (hash: {texture_hash[:8]}...)", "DEBUG")
+                    sync_stats["textures_cached"] = sync_stats.get("textures_cached", 0) + 1
+                    touch_texture_blob(texture_hash)
+                    if cached_data["name"] != image.name:
+                        return dict(cached_data, name=image.name)
+                    return cached_data
+
+                # Detect image format from file extension or image data
+                format_extension = image.name.lower().split('.')[-1] if '.' in image.name else 'png'
+                if format_extension in ['jpg', 'jpeg']:
+                    mime_type = 'image/jpeg'
+                elif format_extension == 'png':
+                    mime_type = 'image/png'
+                elif format_extension in ['bmp']:
+                    mime_type = 'image/bmp'
+                elif format_extension in ['tga']:
+                    mime_type = 'image/tga'
                 else:
-                    log_message(f"TEXTURE: Image '{image.name}' has no file path", "WARNING")
-                    return {"name": image.name, "error": "no_filepath"}
-                
-                if image_data and cache_key:
-                    import base64
-                    
-                    # Encode to base64
-                    base64_data = base64.b64encode(image_data).decode('utf-8')
-                    
-                    # Detect image format from file extension or image data
-                    format_extension = image.name.lower().split('.')[-1] if '.' in image.name else 'png'
-                    if format_extension in ['jpg', 'jpeg']:
-                        mime_type = 'image/jpeg'
-                    elif format_extension == 'png':
-                        mime_type = 'image/png'
-                    elif format_extension in ['bmp']:
-                        mime_type = 'image/bmp'
-                    elif format_extension in ['tga']:
-                        mime_type = 'image/tga'
-                    else:
-                        mime_type = 'image/png'  # default
-                    
-                    data_url = f"data:{mime_type};base64,{base64_data}"
-                    
-                    # Create texture data
-                    texture_data = {
-                        "name": image.name,
-                        "data": data_url,
-                        "size": len(image_data),
-                        "format": format_extension,
-                        "hash": calculate_fast_hash(image_data)
-                    }
-                    
-                    # Cache the result
-                    texture_cache[cache_key] = texture_data
-                    sync_stats["textures_sent"] = sync_stats.get("textures_sent", 0) + 1
-                    
-                    log_message(f"TEXTURE: Encoded and cached '{image.name}' as base64 ({len(base64_data)} chars, {mime_type}, hash: {texture_data['hash'][:8]}...)", "DEBUG")
+                    mime_type = 'image/png'  # default
+
+                # Create texture data; the raw bytes travel in the binary blob section
+                texture_data = {
+                    "name": image.name,
+                    "size": len(image_data),
+                    "format": format_extension,
+                    "mime": mime_type,
+                    "hash": texture_hash
+                }
+
+                # Cache the result by content hash
+                texture_cache[texture_hash] = texture_data
+                store_texture_blob(texture_hash, bytes(image_data))
+                sync_stats["textures_sent"] = sync_stats.get("textures_sent", 0) + 1
+
+                if DEBUG_LOGGING:
+                    log_message(f"TEXTURE: Cached '{image.name}' as binary blob ({len(image_data)} bytes, {mime_type}, hash: {texture_hash[:8]}...)", "DEBUG")
                     log_message(f"TEXTURE: Cache stats - Cached: {sync_stats.get('textures_cached', 0)}, Sent: {sync_stats.get('textures_sent', 0)}", "DEBUG")
-                    log_message(f"TEXTURE: Cache key '{cache_key}' stored with keys: {list(texture_data.keys())}", "DEBUG")
-                    log_message(f"TEXTURE: About to return texture_data: {texture_data}", "DEBUG")
-                    
-                    return texture_data
-                    
+
+                return texture_data
+
             except Exception as e:
                 log_message(f"TEXTURE: Failed to extract texture data: {str(e)}", "ERROR")
                 log_message(f"TEXTURE: Exception type: {type(e)}", "ERROR")
@@ -539,6 +1090,75 @@ def extract_texture_data(socket):
                 return error_result
     return None
 
+
+def find_principled_node(material):
+    """Return the material's Principled BSDF node, checking the last known node name first"""
+    nodes = material.node_tree.nodes
+    cached = material_cache.get(material.as_pointer())
+    if cached:
+        node = nodes.get(cached["node"])
+        if node is not None and node.type == 'BSDF_PRINCIPLED':
+            return node
+
+    for node in nodes:
+        if node.type == 'BSDF_PRINCIPLED':
+            return node
+    return None
+
+
+def linked_source_signature(node):
+    """Identify what feeds a linked socket, so texture edits invalidate the material cache"""
+    if node.type == 'TEX_IMAGE':
+        return lookup_image_pointer(node.image) if node.image else None
+    if node.type == 'NORMAL_MAP':
+        strength = node.inputs.get('Strength')
+        color = node.inputs.get('Color')
+        return (
+            strength.default_value if strength else None,
+            linked_source_signature(color.links[0].from_node) if color and color.is_linked else None,
+        )
+    return node.as_pointer()
+
+
+def principled_input_indices(node):
+    """Map the Principled BSDF inputs this add-on reads to socket indices, probing the first node seen"""
+    if not PRINCIPLED_IDX:
+        socket_index = {node_input.name: i for i, node_input in enumerate(node.inputs)}
+        for name, candidates in PRINCIPLED_INPUT_NAMES.items():
+            for candidate in candidates:
+                if candidate in socket_index:
+                    PRINCIPLED_IDX[name] = socket_index[candidate]
+                    break
+        if DEBUG_LOGGING:
+            log_message(f"MATERIAL: Resolved Principled BSDF inputs: {PRINCIPLED_IDX}", "DEBUG")
+    return PRINCIPLED_IDX
+
+
+def principled_signature(node):
+    """Snapshot of every input value and link source of a Principled BSDF node"""
+    signature = []
+    for node_input in node.inputs:
+        if node_input.is_linked:
+            signature.append(linked_source_signature(node_input.links[0].from_node))
+        elif hasattr(node_input, "default_value"):
+            value = node_input.default_value
+            signature.append(tuple(value) if hasattr(value, "__len__") else value)
+        else:
+            signature.append(None)
+    return tuple(signature)
+
+
+def reuse_cached_material(cached):
+    """Return a cached material dict if every texture is cached here or held by the clients, else None"""
+    textures_used = cached["data"].get("textures", {}).values()
+    if not all(texture_held(texture.get("hash")) for texture in textures_used):
+        return None
+    # Keep textures of cached materials fresh in the LRU order and safe from this pass's eviction
+    for texture in textures_used:
+        touch_texture_blob(texture["hash"])
+    return cached["data"]
+
+
 def extract_material_data(material):
     """Extract material properties for web sync"""
     if not material:
@@ -546,25 +1166,35 @@ def extract_material_data(material):
         return {
             "name": "Default",
             "type": "standard",
-            "color": [0.8, 0.8, 0.8],
+            "color": (0.8, 0.8, 0.8),
             "roughness": 0.7,
             "metalness": 0.3,
-            "emission": [0.0, 0.0, 0.0],
+            "emission": (0.0, 0.0, 0.0),
             "emissionStrength": 0.0,
             "transparency": 0.0,
             "ior": 1.45,
             "normalStrength": 1.0
         }
     
-    log_message(f"MATERIAL: Processing material '{material.name}'", "DEBUG")
+    # No depsgraph update touched this material since its cache entry was confirmed:
+    # skip walking the node tree, but re-check now and then for texture files edited on disk
+    key = material.as_pointer()
+    verified_at = material_verified.get(key)
+    if verified_at is not None and time.time() - verified_at < MATERIAL_RECHECK_INTERVAL and key in material_cache:
+        cached_data = reuse_cached_material(material_cache[key])
+        if cached_data is not None:
+            return cached_data
+
+    if DEBUG_LOGGING:
+        log_message(f"MATERIAL: Processing material '{material.name}'", "DEBUG")
     
     material_data = {
         "name": material.name,
         "type": "standard",
-        "color": [0.8, 0.8, 0.8],
+        "color": (0.8, 0.8, 0.8),
         "roughness": 0.7,
         "metalness": 0.3,
-        "emission": [0.0, 0.0, 0.0],
+        "emission": (0.0, 0.0, 0.0),
         "emissionStrength": 0.0,
         "transparency": 0.0,
         "ior": 1.45,
@@ -573,142 +1203,190 @@ def extract_material_data(material):
     
     # Check if material uses nodes (Principled BSDF)
     if material.use_nodes and material.node_tree:
-        log_message(f"MATERIAL: '{material.name}' uses nodes, searching for Principled BSDF", "DEBUG")
+        if DEBUG_LOGGING:
+            log_message(f"MATERIAL: '{material.name}' uses nodes, searching for Principled BSDF", "DEBUG")
         # Initialize textures dict
         textures = {}
         
-        principled_found = False
-        for node in material.node_tree.nodes:
-            if node.type == 'BSDF_PRINCIPLED':
-                principled_found = True
+        node = find_principled_node(material)
+        principled_found = node is not None
+        if principled_found:
+            # Unchanged inputs and texture sources: reuse the dict built last time
+            cached = material_cache.get(material.as_pointer())
+            signature = principled_signature(node)
+            if cached and cached["signature"] == signature and cached["data"]["name"] == material.name:
+                cached_data = reuse_cached_material(cached)
+                if cached_data is not None:
+                    material_verified[material.as_pointer()] = time.time()
+                    return cached_data
+
+            if DEBUG_LOGGING:
                 log_message(f"MATERIAL: Found Principled BSDF node in '{material.name}'", "DEBUG")
-                # Extract base color
-                if 'Base Color' in node.inputs:
-                    base_color_socket = node.inputs['Base Color']
-                    if base_color_socket.is_linked:
+            inputs = node.inputs
+            idx = principled_input_indices(node)
+            # Extract base color
+            if 'Base Color' in idx:
+                base_color_socket = inputs[idx['Base Color']]
+                if base_color_socket.is_linked:
+                    if DEBUG_LOGGING:
                         log_message(f"MATERIAL: '{material.name}' Base Color is linked to texture", "DEBUG")
-                        # Check for texture
-                        texture_data = extract_texture_data(base_color_socket)
-                        if texture_data:
+                    # Check for texture
+                    texture_data = extract_texture_data(base_color_socket)
+                    if texture_data:
+                        if DEBUG_LOGGING:
                             log_message(f"MATERIAL: extract_texture_data returned: {texture_data}", "DEBUG")
-                            textures["diffuse"] = texture_data
+                        textures["diffuse"] = texture_data
+                        if DEBUG_LOGGING:
                             log_message(f"MATERIAL: '{material.name}' diffuse texture: {texture_data['name']}", "DEBUG")
-                        else:
-                            log_message(f"MATERIAL: '{material.name}' Base Color linked but no texture found", "WARNING")
                     else:
-                        base_color = base_color_socket.default_value
-                        material_data["color"] = [base_color[0], base_color[1], base_color[2]]
+                        log_message(f"MATERIAL: '{material.name}' Base Color linked but no texture found", "WARNING")
+                else:
+                    base_color = base_color_socket.default_value
+                    material_data["color"] = (base_color[0], base_color[1], base_color[2])
+                    if DEBUG_LOGGING:
                         log_message(f"MATERIAL: '{material.name}' Base Color: {material_data['color']}", "DEBUG")
-                
-                # Extract roughness
-                if 'Roughness' in node.inputs:
-                    roughness_socket = node.inputs['Roughness']
-                    if roughness_socket.is_linked:
-                        texture_data = extract_texture_data(roughness_socket)
-                        if texture_data:
-                            textures["roughness"] = texture_data
+            
+            # Extract roughness
+            if 'Roughness' in idx:
+                roughness_socket = inputs[idx['Roughness']]
+                if roughness_socket.is_linked:
+                    texture_data = extract_texture_data(roughness_socket)
+                    if texture_data:
+                        textures["roughness"] = texture_data
+                        if DEBUG_LOGGING:
                             log_message(f"MATERIAL: '{material.name}' roughness texture: {texture_data['name']}", "DEBUG")
-                    else:
-                        material_data["roughness"] = roughness_socket.default_value
+                else:
+                    material_data["roughness"] = roughness_socket.default_value
+                    if DEBUG_LOGGING:
                         log_message(f"MATERIAL: '{material.name}' Roughness: {material_data['roughness']}", "DEBUG")
-                
-                # Extract metallic
-                if 'Metallic' in node.inputs:
-                    metallic_socket = node.inputs['Metallic']
-                    if metallic_socket.is_linked:
-                        texture_data = extract_texture_data(metallic_socket)
-                        if texture_data:
-                            textures["metalness"] = texture_data
+            
+            # Extract metallic
+            if 'Metallic' in idx:
+                metallic_socket = inputs[idx['Metallic']]
+                if metallic_socket.is_linked:
+                    texture_data = extract_texture_data(metallic_socket)
+                    if texture_data:
+                        textures["metalness"] = texture_data
+                        if DEBUG_LOGGING:
                             log_message(f"MATERIAL: '{material.name}' metalness texture: {texture_data['name']}", "DEBUG")
-                    else:
-                        material_data["metalness"] = metallic_socket.default_value
+                else:
+                    material_data["metalness"] = metallic_socket.default_value
+                    if DEBUG_LOGGING:
                         log_message(f"MATERIAL: '{material.name}' Metallic: {material_data['metalness']}", "DEBUG")
-                
-                # Extract normal map
-                if 'Normal' in node.inputs:
-                    normal_socket = node.inputs['Normal']
-                    if normal_socket.is_linked:
-                        # Check if it's connected to a normal map node
-                        linked_node = normal_socket.links[0].from_node
-                        if linked_node.type == 'NORMAL_MAP':
-                            color_socket = linked_node.inputs.get('Color')
-                            if color_socket and color_socket.is_linked:
-                                texture_data = extract_texture_data(color_socket)
-                                if texture_data:
-                                    textures["normal"] = texture_data
-                                    material_data["normalStrength"] = linked_node.inputs.get('Strength', type(None)).default_value if linked_node.inputs.get('Strength') else 1.0
-                
-                # Extract emission
-                if 'Emission' in node.inputs:
-                    emission_socket = node.inputs['Emission']
-                    if emission_socket.is_linked:
-                        texture_data = extract_texture_data(emission_socket)
-                        if texture_data:
-                            textures["emission"] = texture_data
-                    else:
-                        emission = emission_socket.default_value
-                        material_data["emission"] = [emission[0], emission[1], emission[2]]
-                        
-                if 'Emission Strength' in node.inputs:
-                    material_data["emissionStrength"] = node.inputs['Emission Strength'].default_value
+            
+            # Extract normal map
+            if 'Normal' in idx:
+                normal_socket = inputs[idx['Normal']]
+                if normal_socket.is_linked:
+                    # Check if it's connected to a normal map node
+                    linked_node = normal_socket.links[0].from_node
+                    if linked_node.type == 'NORMAL_MAP':
+                        color_socket = linked_node.inputs.get('Color')
+                        if color_socket and color_socket.is_linked:
+                            texture_data = extract_texture_data(color_socket)
+                            if texture_data:
+                                textures["normal"] = texture_data
+                                material_data["normalStrength"] = linked_node.inputs.get('Strength', type(None)).default_value if linked_node.inputs.get('Strength') else 1.0
+            
+            # Extract emission
+            if 'Emission' in idx:
+                emission_socket = inputs[idx['Emission']]
+                if emission_socket.is_linked:
+                    texture_data = extract_texture_data(emission_socket)
+                    if texture_data:
+                        textures["emission"] = texture_data
+                else:
+                    emission = emission_socket.default_value
+                    material_data["emission"] = (emission[0], emission[1], emission[2])
                     
-                # Set type based on emission
-                if material_data["emissionStrength"] > 0:
-                    material_data["type"] = "emission"
-                
-                # Extract transparency/transmission
-                if 'Transmission' in node.inputs:
-                    transmission = node.inputs['Transmission'].default_value
-                    if transmission > 0:
-                        material_data["type"] = "glass"
-                        material_data["transparency"] = transmission
-                
-                if 'Alpha' in node.inputs:
-                    alpha = node.inputs['Alpha'].default_value
-                    if alpha < 1.0:
-                        material_data["type"] = "transparent"
-                        material_data["transparency"] = 1.0 - alpha
+            if 'Emission Strength' in idx:
+                material_data["emissionStrength"] = inputs[idx['Emission Strength']].default_value
                 
-                # Extract IOR
-                if 'IOR' in node.inputs:
-                    material_data["ior"] = node.inputs['IOR'].default_value
-                
-                # Extract clearcoat
-                if 'Clearcoat' in node.inputs:
-                    clearcoat = node.inputs['Clearcoat'].default_value
-                    if clearcoat > 0:
-                        material_data["clearcoat"] = clearcoat
-                        if 'Clearcoat Roughness' in node.inputs:
-                            material_data["clearcoatRoughness"] = node.inputs['Clearcoat Roughness'].default_value
-                
-                # Add textures if any were found
-                if textures:
-                    material_data["textures"] = textures
+            # Set type based on emission
+            if material_data["emissionStrength"] > 0:
+                material_data["type"] = "emission"
+            
+            # Extract transparency/transmission
+            if 'Transmission' in idx:
+                transmission = inputs[idx['Transmission']].default_value
+                if transmission > 0:
+                    material_data["type"] = "glass"
+                    material_data["transparency"] = transmission
+            
+            if 'Alpha' in idx:
+                alpha = inputs[idx['Alpha']].default_value
+                if alpha < 1.0:
+                    material_data["type"] = "transparent"
+                    material_data["transparency"] = 1.0 - alpha
+            
+            # Extract IOR
+            if 'IOR' in idx:
+                material_data["ior"] = inputs[idx['IOR']].default_value
+            
+            # Extract clearcoat
+            if 'Clearcoat' in idx:
+                clearcoat = inputs[idx['Clearcoat']].default_value
+                if clearcoat > 0:
+                    material_data["clearcoat"] = clearcoat
+                    if 'Clearcoat Roughness' in idx:
+                        material_data["clearcoatRoughness"] = inputs[idx['Clearcoat Roughness']].default_value
+            
+            # Add textures if any were found
+            if textures:
+                material_data["textures"] = textures
+                if DEBUG_LOGGING:
                     log_message(f"MATERIAL: '{material.name}' has {len(textures)} textures: {list(textures.keys())}", "DEBUG")
-                else:
+            else:
+                if DEBUG_LOGGING:
                     log_message(f"MATERIAL: '{material.name}' has no textures", "DEBUG")
-                
-                break
+
+            material_cache[material.as_pointer()] = {
+                "node": node.name,
+                "signature": signature,
+                "data": material_data,
+            }
+            material_verified[material.as_pointer()] = time.time()
         
         if not principled_found:
             log_message(f"MATERIAL: '{material.name}' - No Principled BSDF found in node tree", "WARNING")
     else:
-        log_message(f"MATERIAL: '{material.name}' does not use nodes, using legacy properties", "DEBUG")
+        if DEBUG_LOGGING:
+            log_message(f"MATERIAL: '{material.name}' does not use nodes, using legacy properties", "DEBUG")
         # Fallback to legacy material properties
         if hasattr(material, 'diffuse_color'):
-            material_data["color"] = [material.diffuse_color[0], material.diffuse_color[1], material.diffuse_color[2]]
-            log_message(f"MATERIAL: '{material.name}' legacy diffuse color: {material_data['color']}", "DEBUG")
+            material_data["color"] = (material.diffuse_color[0], material.diffuse_color[1], material.diffuse_color[2])
+            if DEBUG_LOGGING:
+                log_message(f"MATERIAL: '{material.name}' legacy diffuse color: {material_data['color']}", "DEBUG")
         if hasattr(material, 'roughness'):
             material_data["roughness"] = material.roughness
-            log_message(f"MATERIAL: '{material.name}' legacy roughness: {material_data['roughness']}", "DEBUG")
+            if DEBUG_LOGGING:
+                log_message(f"MATERIAL: '{material.name}' legacy roughness: {material_data['roughness']}", "DEBUG")
         if hasattr(material, 'metallic'):
             material_data["metalness"] = material.metallic
-            log_message(f"MATERIAL: '{material.name}' legacy metallic: {material_data['metalness']}", "DEBUG")
+            if DEBUG_LOGGING:
+                log_message(f"MATERIAL: '{material.name}' legacy metallic: {material_data['metalness']}", "DEBUG")
     
-    log_message(f"MATERIAL: Final data for '{material.name}': type={material_data['type']}, color={material_data['color']}, roughness={material_data['roughness']}, metalness={material_data['metalness']}", "DEBUG")
+    if DEBUG_LOGGING:
+        log_message(f"MATERIAL: Final data for '{material.name}': type={material_data['type']}, color={material_data['color']}, roughness={material_data['roughness']}, metalness={material_data['metalness']}", "DEBUG")
     return material_data
 
 
+# Blender light type -> web client light type
+LIGHT_TYPE_MAP = {
+    'SUN': 'sun',
+    'POINT': 'point',
+    'SPOT': 'spot',
+    'AREA': 'area'
+}
+
+# World values used when the scene has no world or no Background node
+WORLD_DEFAULTS = {
+    "backgroundColor": (0.05, 0.05, 0.05),  # Default dark background
+    "ambientColor": (1.0, 1.0, 1.0),
+    "ambientStrength": 0.1
+}
+
+
 def extract_light_data():
     """Extract light data from the scene"""
     lights_data = []
@@ -717,20 +1395,12 @@ def extract_light_data():
         if obj.type == 'LIGHT':
             light = obj.data
             
-            # Convert Blender light type to our format
-            light_type_map = {
-                'SUN': 'sun',
-                'POINT': 'point',
-                'SPOT': 'spot',
-                'AREA': 'area'
-            }
-            
             light_data = {
                 "name": obj.name,
-                "type": light_type_map.get(light.type, 'point'),
-                "position": [obj.location.x, obj.location.y, obj.location.z],
-                "rotation": [obj.rotation_euler.x, obj.rotation_euler.y, obj.rotation_euler.z],
-                "color": [light.color[0], light.color[1], light.color[2]],
+                "type": LIGHT_TYPE_MAP.get(light.type, 'point'),
+                "position": (obj.location.x, obj.location.y, obj.location.z),
+                "rotation": (obj.rotation_euler.x, obj.rotation_euler.y, obj.rotation_euler.z),
+                "color": (light.color[0], light.color[1], light.color[2]),
                 "energy": light.energy
             }
             
@@ -754,11 +1424,8 @@ def extract_world_data():
     """Extract world/environment data"""
     world = bpy.context.scene.world
     
-    world_data = {
-        "backgroundColor": [0.05, 0.05, 0.05],  # Default dark background
-        "ambientColor": [1.0, 1.0, 1.0],
-        "ambientStrength": 0.1
-    }
+    # Shallow copy is enough: the default values are immutable tuples
+    world_data = dict(WORLD_DEFAULTS)
     
     if world:
         # Extract world color from shader nodes
@@ -767,211 +1434,282 @@ def extract_world_data():
                 if node.type == 'BACKGROUND':
                     if 'Color' in node.inputs:
                         bg_color = node.inputs['Color'].default_value
-                        world_data["backgroundColor"] = [bg_color[0], bg_color[1], bg_color[2]]
+                        world_data["backgroundColor"] = (bg_color[0], bg_color[1], bg_color[2])
                     if 'Strength' in node.inputs:
                         world_data["ambientStrength"] = node.inputs['Strength'].default_value * 0.1
                     break
         else:
             # Fallback to legacy world color
             if hasattr(world, 'color'):
-                world_data["backgroundColor"] = [world.color[0], world.color[1], world.color[2]]
+                world_data["backgroundColor"] = (world.color[0], world.color[1], world.color[2])
     
     return world_data
 
 
+def read_mesh_buffers(mesh):
+    """Copy the arrays pack_mesh_arrays needs out of a mesh with foreach_get
+
+    Expects mesh.calc_loop_triangles() to have been called. This is the only part of
+    mesh extraction that touches bpy, so it must run on the main thread.
+    """
+    triangle_count = len(mesh.loop_triangles)
+
+    co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", co)
+    buffers = {"co": co.reshape(-1, 3)}
+
+    if mesh.uv_layers.active:
+        buffers["tri_loops"] = np.empty(triangle_count * 3, dtype=np.int32)
+        mesh.loop_triangles.foreach_get("loops", buffers["tri_loops"])
+
+        buffers["loop_vertex_index"] = np.empty(len(mesh.loops), dtype=np.int32)
+        mesh.loops.foreach_get("vertex_index", buffers["loop_vertex_index"])
+        buffers["uv"] = np.empty(len(mesh.loops) * 2, dtype=np.float32)
+        mesh.uv_layers.active.data.foreach_get("uv", buffers["uv"])
+
+        buffers["tri_smooth"] = np.empty(triangle_count, dtype=bool)
+        buffers["tri_polygon"] = np.empty(triangle_count, dtype=np.int32)
+        mesh.loop_triangles.foreach_get("use_smooth", buffers["tri_smooth"])
+        mesh.loop_triangles.foreach_get("polygon_index", buffers["tri_polygon"])
+    else:
+        buffers["faces"] = np.empty(triangle_count * 3, dtype=np.int32)
+        mesh.loop_triangles.foreach_get("vertices", buffers["faces"])
+    return buffers
+
+
+def pack_mesh_arrays(buffers):
+    """Build (vertices, faces, uvs) from read_mesh_buffers output, without touching bpy
+
+    With a UV layer, triangle corners are deduplicated on (vertex, uv), since Blender
+    stores UVs per loop; without one, vertices are shared and uvs is None. Pure numpy
+    on plain byte and float dtypes, whose sorts release the GIL, so it can run on the
+    pack pool while other meshes are packed. The arrays already have the
+    MESH_ARRAY_FIELDS dtypes, so encoding them copies nothing.
+    """
+    co = buffers["co"]
+    if "uv" not in buffers:
+        # Indices are never negative: reinterpret as the uint32 the wire format uses, no copy
+        return co, buffers["faces"].view(np.uint32).reshape(-1, 3), None
+
+    tri_loops = buffers["tri_loops"]
+    corner_uv = buffers["uv"].reshape(-1, 2)[tri_loops]
+
+    # Corners of flat-shaded faces only merge within their own polygon, so the
+    # normals the web client computes stay faceted there
+    dots = np.empty(len(tri_loops), dtype=[("v", "i4"), ("g", "i4"), ("u", "f4"), ("t", "f4")])
+    dots["v"] = buffers["loop_vertex_index"][tri_loops]
+    dots["g"] = np.where(buffers["tri_smooth"], -1, buffers["tri_polygon"]).repeat(3)
+    dots["u"] = corner_uv[:, 0]
+    dots["t"] = corner_uv[:, 1]
+    # Sorting a structured dtype compares field by field under the GIL; the same
+    # 16-byte records viewed as opaque void compare with memcmp and release it
+    unique, inverse = np.unique(dots.view(np.dtype((np.void, dots.dtype.itemsize))), return_inverse=True)
+    unique = unique.view(dots.dtype)
+
+    vertices = co[unique["v"]]
+    uvs = np.stack([unique["u"], unique["t"]], axis=1)
+    faces = inverse.astype(np.uint32).reshape(-1, 3)
+    return vertices, faces, uvs
+
+
+def get_mesh_pack_pool():
+    """Thread pool for pack_mesh_arrays, created on first use"""
+    global mesh_pack_pool
+    if mesh_pack_pool is None:
+        mesh_pack_pool = ThreadPoolExecutor(
+            max_workers=min(8, os.cpu_count() or 1), thread_name_prefix="WebSyncPack"
+        )
+    return mesh_pack_pool
+
+
 def send_mesh_data():
     """Function to send mesh data with materials and lighting"""
-    global is_server_running, last_data
+    global is_server_running, lights_cache, world_cache, lights_dirty, world_dirty
 
     if not is_server_running:
         return
 
+    dirty_geometry = set()
     try:
-        for window in bpy.context.window_manager.windows:
-            screen = window.screen
-            for area in screen.areas:
-                if area.type == "VIEW_3D":
-                    # Get all visible mesh objects
-                    all_objects = [obj for obj in window.view_layer.objects]
-                    mesh_objects = [
-                        obj
-                        for obj in all_objects
-                        if obj.type == "MESH" and obj.visible_get()
-                    ]
-
-                    log_message(f"DEBUG: Total objects in scene: {len(all_objects)}")
-                    log_message(f"DEBUG: Mesh objects found: {len(mesh_objects)}")
-                    for obj in mesh_objects:
-                        log_message(
-                            f"DEBUG: Found mesh object: {obj.name} (visible: {obj.visible_get()})"
-                        )
-
-                    if not mesh_objects:
-                        log_message("No visible mesh objects", "WARNING")
-                        break
-
-                    log_message(f"Processing {len(mesh_objects)} mesh objects")
-
-                    # Create scene data structure
-                    scene_objects = []
-                    depsgraph = window.view_layer.depsgraph
-
-                    for obj in mesh_objects:
-                        log_message(f"  Processing object: {obj.name}")
-
-                        # Ensure mesh data is up to date
-                        obj_eval = obj.evaluated_get(depsgraph)
-                        mesh = obj_eval.to_mesh()
-
-                        # Triangulate mesh
-                        import bmesh
-
-                        bm = bmesh.new()
-                        bm.from_mesh(mesh)
-                        bmesh.ops.triangulate(bm, faces=bm.faces)
-                        bm.to_mesh(mesh)
-                        bm.free()
-
-                        log_message(
-                            f"    Vertices: {len(mesh.vertices)}, Faces: {len(mesh.polygons)}"
-                        )
-
-                        # For proper UV mapping, we need to create unique vertices for each face corner
-                        # This is because Blender stores UVs per-loop, not per-vertex
-                        
-                        vertices = []
-                        faces = []
-                        uvs = []
-                        has_uvs = False
-                        
-                        if mesh.uv_layers.active:
-                            has_uvs = True
-                            uv_layer = mesh.uv_layers.active.data
+        # One evaluated depsgraph serves the whole scene, independent of open windows
+        depsgraph = bpy.context.evaluated_depsgraph_get()
+
+        # Get all visible mesh objects
+        all_objects = bpy.context.scene.objects
+        mesh_objects = [
+            obj
+            for obj in all_objects
+            if obj.type == "MESH" and obj.visible_get()
+        ]
+
+        if DEBUG_LOGGING:
+            log_message(f"Total objects in scene: {len(all_objects)}", "DEBUG")
+            log_message(f"Mesh objects found: {len(mesh_objects)}", "DEBUG")
+            for obj in mesh_objects:
+                log_message(f"Found mesh object: {obj.name} (visible: {obj.visible_get()})", "DEBUG")
+
+        if not mesh_objects:
+            log_message("No visible mesh objects", "WARNING")
+            return
+
+        log_message(f"Processing {len(mesh_objects)} mesh objects")
+
+        # Create scene data structure
+        scene_objects = []
+
+        # Only geometry flagged by depsgraph updates since the last sync is re-extracted
+        dirty_geometry = set(geometry_dirty)
+        geometry_dirty.clear()
+        live_objects = set()
+        pending_geometry = []  # (pointer, name, geometry, buffers) still to be packed
+        object_geometries = []  # geometry dict per entry of scene_objects
+
+        # World matrices of all objects go out as one (N, 4, 4) buffer, in object order
+        transforms = np.empty((len(mesh_objects), 4, 4), dtype=np.float32)
+
+        for index, obj in enumerate(mesh_objects):
+            if DEBUG_LOGGING:
+                log_message(f"  Processing object: {obj.name}", "DEBUG")
+            transforms[index] = obj.matrix_world
+            pointer = obj.as_pointer()
+            live_objects.add(pointer)
+
+            matrix_bytes = transforms[index].tobytes()
+            last_matrix, transform_epoch = object_transform_epochs.get(pointer, (None, None))
+            if matrix_bytes != last_matrix:
+                transform_epoch = next(transform_epochs)
+                object_transform_epochs[pointer] = (matrix_bytes, transform_epoch)
+
+            geometry = object_geometry_cache.get(pointer)
+            if geometry is None or pointer in dirty_geometry or obj.data.as_pointer() in dirty_geometry:
+                # Ensure mesh data is up to date
+                obj_eval = obj.evaluated_get(depsgraph)
+                mesh = obj_eval.to_mesh()
+                try:
+                    # Triangulation comes from Blender's loop triangle table, no bmesh copy
+                    mesh.calc_loop_triangles()
+
+                    if DEBUG_LOGGING:
+                        log_message(f"    Vertices: {len(mesh.vertices)}, Faces: {len(mesh.polygons)}, Triangles: {len(mesh.loop_triangles)}", "DEBUG")
+
+                    # Only the bpy reads happen here; packing runs after the loop, in parallel
+                    buffers = read_mesh_buffers(mesh)
+
+                    if "uv" in buffers:
+                        if DEBUG_LOGGING:
                             log_message(f"OBJECT: '{obj.name}' has UV layer '{mesh.uv_layers.active.name}'", "DEBUG")
-                            
-                            # Create vertices and UVs per face corner (loop)
-                            vertex_index = 0
-                            face_count = 0
-                            
-                            for poly in mesh.polygons:
-                                if len(poly.vertices) == 3:  # Only process triangles
-                                    face_indices = []
-                                    face_uvs = []
-                                    
-                                    for loop_index in range(poly.loop_start, poly.loop_start + poly.loop_total):
-                                        loop = mesh.loops[loop_index]
-                                        vertex = mesh.vertices[loop.vertex_index]
-                                        uv_coord = uv_layer[loop_index].uv
-                                        
-                                        # Keep vertex in local coordinates for proper transform matrix application
-                                        co = vertex.co
-                                        vertices.append([co.x, co.y, co.z])
-                                        
-                                        # Store UV coordinate
-                                        uvs.append([uv_coord.x, uv_coord.y])
-                                        face_uvs.append([uv_coord.x, uv_coord.y])
-                                        
-                                        # Add to face
-                                        face_indices.append(vertex_index)
-                                        vertex_index += 1
-                                    
-                                    faces.append(face_indices)
-                                    
-                                    # Debug first few faces
-                                    if face_count < 6:
-                                        log_message(f"OBJECT: '{obj.name}' face {face_count}: vertices {face_indices}, UVs {face_uvs}", "DEBUG")
-                                    face_count += 1
-                            
-                            log_message(f"OBJECT: '{obj.name}' created {len(vertices)} unique vertices with UVs from {len(mesh.polygons)} faces", "DEBUG")
-                            log_message(f"OBJECT: '{obj.name}' extracted {len(uvs)} UV coordinates", "DEBUG")
-                        else:
-                            log_message(f"OBJECT: '{obj.name}' has no UV coordinates, using simple vertex mapping", "WARNING")
-                            
-                            # Fallback: simple vertex mapping without UVs
-                            for v in mesh.vertices:
-                                co = v.co
-                                vertices.append([co.x, co.y, co.z])
-
-                            for p in mesh.polygons:
-                                if len(p.vertices) == 3:  # Only process triangles
-                                    faces.append([p.vertices[0], p.vertices[1], p.vertices[2]])
-
-                        # Extract materials
-                        materials = []
-                        if obj.material_slots:
-                            log_message(f"OBJECT: '{obj.name}' has {len(obj.material_slots)} material slots", "DEBUG")
-                            for i, slot in enumerate(obj.material_slots):
-                                log_message(f"OBJECT: '{obj.name}' slot {i}: {slot.material.name if slot.material else 'None'}", "DEBUG")
-                                materials.append(extract_material_data(slot.material))
-                        else:
-                            log_message(f"OBJECT: '{obj.name}' has no material slots, using default", "DEBUG")
-                            materials.append(extract_material_data(None))
-
-                        # Create object data
-                        object_data = {
-                            "name": obj.name,
-                            "vertices": vertices,
-                            "faces": faces,
-                            "transform": [list(row) for row in obj.matrix_world],
-                            "materials": materials
-                        }
-                        
-                        
-                        # Add UV coordinates if available
-                        if has_uvs and uvs:
-                            object_data["uvs"] = uvs
-                            log_message(f"OBJECT: '{obj.name}' included {len(uvs)} UV coordinates in data", "DEBUG")
-                        else:
-                            log_message(f"OBJECT: '{obj.name}' no UV coordinates to include", "DEBUG")
-
-                        scene_objects.append(object_data)
-
-                        # Clean up temporary mesh
-                        obj_eval.to_mesh_clear()
-
-                    # Extract lighting data
-                    lights_data = extract_light_data()
-                    log_message(f"DEBUG: Found {len(lights_data)} lights")
-
-                    # Extract world data
-                    world_data = extract_world_data()
-
-                    # Create complete scene data
-                    scene_data = {
-                        "objects": scene_objects,
-                        "lights": lights_data,
-                        "world": world_data
-                    }
-
-                    log_message(f"DEBUG: Scene data contains:")
-                    log_message(f"DEBUG: - Objects: {len(scene_objects)}")
-                    log_message(f"DEBUG: - Lights: {len(lights_data)}")
-                    log_message(f"DEBUG: - World data: {bool(world_data)}")
-
-                    # Convert data to JSON string
-                    data_str = json.dumps(scene_data)
-                    data_size = len(data_str.encode())
-
-                    # Send if data is different from last time
-                    if data_str != last_data:
-                        log_message(
-                            f"Preparing to send scene data with materials and lighting, size: {format_bytes(data_size)}"
-                        )
-                        if send_data(data_str):
-                            last_data = data_str
-                            update_sync_stats(data_size)
-                            log_message("Scene data with materials and lighting sent successfully")
                     else:
-                        log_message("Scene data unchanged, skipping send")
-                    break
-            break
+                        log_message(f"OBJECT: '{obj.name}' has no UV coordinates, using simple vertex mapping", "WARNING")
+                finally:
+                    # Release the evaluated mesh even if extraction fails mid-loop
+                    obj_eval.to_mesh_clear()
+
+                geometry = {"version": next(geometry_versions)}
+                pending_geometry.append((pointer, obj.name, geometry, buffers))
+                object_geometry_cache.pop(pointer, None)
+            else:
+                if DEBUG_LOGGING:
+                    log_message(f"OBJECT: '{obj.name}' geometry unchanged, reusing cached arrays", "DEBUG")
+
+            # Extract materials
+            materials = []
+            if obj.material_slots:
+                if DEBUG_LOGGING:
+                    log_message(f"OBJECT: '{obj.name}' has {len(obj.material_slots)} material slots", "DEBUG")
+                for i, slot in enumerate(obj.material_slots):
+                    if DEBUG_LOGGING:
+                        log_message(f"OBJECT: '{obj.name}' slot {i}: {slot.material.name if slot.material else 'None'}", "DEBUG")
+                    materials.append(extract_material_data(slot.material))
+            else:
+                if DEBUG_LOGGING:
+                    log_message(f"OBJECT: '{obj.name}' has no material slots, using default", "DEBUG")
+                materials.append(extract_material_data(None))
+
+            # Create object data
+            object_data = {
+                "name": obj.name,
+                "materials": materials,
+                "geometryVersion": geometry["version"],
+                "transformEpoch": transform_epoch,
+            }
+            scene_objects.append(object_data)
+            object_geometries.append(geometry)
+
+        # Corner deduplication sorts raw bytes, which releases the GIL, so dirty meshes pack in parallel
+        pending_buffers = [buffers for _, _, _, buffers in pending_geometry]
+        if len(pending_buffers) > 1:
+            packed = get_mesh_pack_pool().map(pack_mesh_arrays, pending_buffers)
+        else:
+            packed = map(pack_mesh_arrays, pending_buffers)
+        for (pointer, name, geometry, _), (vertices, faces, uvs) in zip(pending_geometry, packed):
+            geometry.update(vertices=vertices, faces=faces, uvs=uvs)
+            # Cached only once packed, so a failed pack is retried on the next sync
+            object_geometry_cache[pointer] = geometry
+            if DEBUG_LOGGING and uvs is not None:
+                log_message(f"OBJECT: '{name}' created {len(vertices)} unique vertices with UVs from {len(faces)} triangles", "DEBUG")
+
+        for object_data, geometry in zip(scene_objects, object_geometries):
+            object_data["vertices"] = geometry["vertices"]
+            object_data["faces"] = geometry["faces"]
+
+            # Add UV coordinates if available
+            uvs = geometry["uvs"]
+            if uvs is not None and len(uvs):
+                object_data["uvs"] = uvs
+                if DEBUG_LOGGING:
+                    log_message(f"OBJECT: '{object_data['name']}' included {len(uvs)} UV coordinates in data", "DEBUG")
+            else:
+                if DEBUG_LOGGING:
+                    log_message(f"OBJECT: '{object_data['name']}' no UV coordinates to include", "DEBUG")
+
+        # Forget geometry of objects that were deleted or hidden
+        for pointer in object_geometry_cache.keys() - live_objects:
+            del object_geometry_cache[pointer]
+        for pointer in object_transform_epochs.keys() - live_objects:
+            del object_transform_epochs[pointer]
+
+        # Extract lighting and world data, unless no depsgraph update touched them
+        if lights_dirty or lights_cache is None:
+            lights_cache = extract_light_data()
+            lights_dirty = False
+        lights_data = lights_cache
+        if DEBUG_LOGGING:
+            log_message(f"Found {len(lights_data)} lights", "DEBUG")
+
+        if world_dirty or world_cache is None:
+            world_cache = extract_world_data()
+            world_dirty = False
+        world_data = world_cache
+
+        # Create complete scene data
+        scene_data = {
+            "objects": scene_objects,
+            "transforms": transforms,
+            "lights": lights_data,
+            "world": world_data
+        }
+
+        if DEBUG_LOGGING:
+            log_message("Scene data contains:", "DEBUG")
+            log_message(f"- Objects: {len(scene_objects)}", "DEBUG")
+            log_message(f"- Lights: {len(lights_data)}", "DEBUG")
+            log_message(f"- World data: {bool(world_data)}", "DEBUG")
+
+        # The send thread encodes and skips the scene if nothing changed
+        if send_data(scene_data):
+            log_message("Scene data with materials and lighting queued for sending")
     except Exception as e:
+        # Keep the dirty flags this sync took, so objects it never reached are re-extracted next time
+        geometry_dirty.update(dirty_geometry)
         error_msg = f"Error sending data: {str(e)}"
         log_message(error_msg, "ERROR")
         update_sync_stats(is_error=True)
         import traceback
 
         log_message(traceback.format_exc(), "ERROR")
+    finally:
+        # The scene's blobs are snapshotted by now; only unreferenced textures can go
+        evict_texture_blobs()
 
 
 class WebSyncSettings(bpy.types.PropertyGroup):
@@ -987,14 +1725,20 @@ class StartWebSyncServer(bpy.types.Operator):
     bl_label = "Start Sync"
 
     def execute(self, context):
-        global tcp_socket, is_server_running, receive_thread, stop_receive_thread
+        global tcp_socket, is_server_running, receive_thread, stop_receive_thread, payload_codec, send_thread
 
         if not is_server_running:
+            if send_thread and send_thread.is_alive():
+                # A second sender on the same stream would interleave frames
+                error_msg = "Previous send thread is still running, try again shortly"
+                log_message(error_msg, "ERROR")
+                self.report({"ERROR"}, error_msg)
+                return {"CANCELLED"}
             try:
                 log_message("Connecting to server...")
-                tcp_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                tcp_socket.settimeout(1.0)  # Set timeout for receive operations
-                tcp_socket.connect(("localhost", context.scene.web_sync_settings.port))
+                tcp_socket = create_sync_socket(context.scene.web_sync_settings.port)
+                # zlib until this server's hello says otherwise
+                payload_codec = CODEC_ZLIB
                 is_server_running = True
                 context.scene.web_sync_settings.is_running = True
 
@@ -1009,8 +1753,22 @@ class StartWebSyncServer(bpy.types.Operator):
                     "errors": 0,
                     "textures_cached": 0,
                     "textures_sent": 0,
+                    "coalesced": 0,
+                    "texture_cache_bytes": texture_blobs_size,
                 }
                 
+                # Clients start without any texture blobs or scene
+                sent_texture_hashes.clear()
+                sent_geometry_versions.clear()
+                # Geometry, material, light and world edits made while stopped were not tracked
+                object_geometry_cache.clear()
+                material_verified.clear()
+                global lights_dirty, world_dirty
+                lights_dirty = True
+                world_dirty = True
+                global last_data_hash
+                last_data_hash = 0
+
                 # Reset received data tracking
                 received_transform_data = {
                     "last_received": None,
@@ -1033,6 +1791,14 @@ class StartWebSyncServer(bpy.types.Operator):
                 receive_thread = threading.Thread(target=receive_messages, daemon=True)
                 receive_thread.start()
 
+                # Start send thread so compression and socket writes stay off the main thread
+                global send_thread_stop, pending_payload
+                pending_payload = None  # Discard a payload left from a previous session
+                payload_ready.clear()
+                send_thread_stop = threading.Event()
+                send_thread = threading.Thread(target=send_messages, args=(tcp_socket, send_thread_stop), daemon=True)
+                send_thread.start()
+
                 log_message("Connected to server with bidirectional communication")
 
             except Exception as e:
@@ -1060,6 +1826,9 @@ class StopWebSyncServer(bpy.types.Operator):
         if receive_thread and receive_thread.is_alive():
             receive_thread.join(timeout=2.0)
 
+        # Stop send thread
+        stop_sender(tcp_socket)
+
         if tcp_socket:
             tcp_socket.close()
             tcp_socket = None
@@ -1105,25 +1874,69 @@ class WebSyncPanel(bpy.types.Panel):
 
 @persistent
 def load_handler(dummy):
-    global tcp_socket, is_server_running, stop_receive_thread
+    global tcp_socket, is_server_running, stop_receive_thread, transform_drain_scheduled, pending_sync
+    global lights_dirty, world_dirty
     is_server_running = False
     stop_receive_thread = True
+    stop_sender(tcp_socket)
     if tcp_socket:
         tcp_socket.close()
         tcp_socket = None
+    # Datablock pointers from the previous file are no longer valid
+    image_pointer_cache.clear()
+    material_cache.clear()
+    material_verified.clear()
+    object_geometry_cache.clear()
+    object_transform_epochs.clear()
+    geometry_dirty.clear()
+    lights_dirty = True
+    world_dirty = True
+    # Loading a file drops registered timers, including a pending transform or sync drain
+    with pending_transforms_lock:
+        pending_transforms.clear()
+        transform_drain_scheduled = False
+    pending_sync = False
     if hasattr(bpy.context.scene, "web_sync_settings"):
         bpy.context.scene.web_sync_settings.is_running = False
     log_message("Scene loaded, sync server reset")
 
 
+def record_depsgraph_updates(depsgraph):
+    """Invalidate cached geometry, materials, lights and world touched by this depsgraph update"""
+    global lights_dirty, world_dirty
+    for update in depsgraph.updates:
+        datablock = update.id.original
+        if update.is_updated_geometry:
+            geometry_dirty.add(datablock.as_pointer())
+        if isinstance(datablock, bpy.types.Material):
+            material_verified.pop(datablock.as_pointer(), None)
+        elif isinstance(datablock, (bpy.types.NodeTree, bpy.types.Image)):
+            # Node groups and images can be shared by any material; fall back to signature checks
+            material_verified.clear()
+            world_dirty = True
+        elif isinstance(datablock, bpy.types.Light):
+            lights_dirty = True
+        elif isinstance(datablock, bpy.types.Object):
+            if datablock.type == 'LIGHT':
+                lights_dirty = True
+        elif isinstance(datablock, bpy.types.Collection):
+            # Objects were linked or unlinked, lights may have been added or deleted
+            lights_dirty = True
+        elif isinstance(datablock, (bpy.types.World, bpy.types.Scene)):
+            world_dirty = True
+
+
 @persistent
 def depsgraph_update_handler(scene, depsgraph):
     """Handler function for scene updates with anti-feedback protection and throttling"""
-    global is_applying_external_transform, external_transform_cooldown_end, last_depsgraph_sync_time
+    global is_applying_external_transform, external_transform_cooldown_end, last_depsgraph_sync_time, pending_sync
     
     if not is_server_running:
         return
     
+    # Remember geometry changes even when this update is skipped or throttled
+    record_depsgraph_updates(depsgraph)
+    
     # Check if we're currently applying an external transform
     if is_applying_external_transform:
         log_message("⏸️ Skipping mesh sync - currently applying external transform to prevent feedback")
@@ -1141,27 +1954,54 @@ def depsgraph_update_handler(scene, depsgraph):
     update_frequency = getattr(settings, 'update_frequency', 10)  # Default to 10Hz
     min_interval = 1.0 / update_frequency  # Convert Hz to seconds
     
-    # Check throttling
+    # Check throttling: updates inside the window are coalesced, not dropped
     time_since_last_sync = current_time - last_depsgraph_sync_time
     if time_since_last_sync < min_interval:
         remaining_wait = min_interval - time_since_last_sync
-        log_message(f"⏳ Throttling mesh sync - waiting {remaining_wait:.3f}s ({update_frequency}Hz limit)")
+        pending_sync = True
+        if not bpy.app.timers.is_registered(drain_pending_sync):
+            bpy.app.timers.register(drain_pending_sync, first_interval=remaining_wait)
+        log_message(f"⏳ Throttling mesh sync - sending latest state in {remaining_wait:.3f}s ({update_frequency}Hz limit)")
         return
     
     # Normal mesh sync
+    pending_sync = False
     last_depsgraph_sync_time = current_time
     log_message(f"📡 Sending mesh update ({update_frequency}Hz throttle)")
     send_mesh_data()
 
 
+def drain_pending_sync():
+    """Timer function: send the scene once for all depsgraph updates coalesced in the throttle window"""
+    global pending_sync, last_depsgraph_sync_time
+
+    if not is_server_running or not pending_sync:
+        pending_sync = False
+        return None
+
+    # An external transform is being applied; send once the cooldown is over
+    current_time = time.time()
+    if is_applying_external_transform or current_time < external_transform_cooldown_end:
+        return max(external_transform_cooldown_end - current_time, 0.01)
+
+    pending_sync = False
+    last_depsgraph_sync_time = current_time
+    log_message("📡 Sending coalesced mesh update")
+    send_mesh_data()
+    return None  # Don't reschedule
+
+
 @persistent 
 def frame_change_handler(scene, depsgraph):
     """Handler function for animation frame changes with anti-feedback protection"""
-    global last_frame_sync_time, is_applying_external_transform, external_transform_cooldown_end
+    global is_applying_external_transform, external_transform_cooldown_end
     
     if not is_server_running:
         return
     
+    # Only meshes the frame change actually deformed are re-extracted
+    record_depsgraph_updates(depsgraph)
+    
     # Check anti-feedback protection
     if is_applying_external_transform:
         log_message("⏸️ Skipping frame sync - currently applying external transform to prevent feedback")
@@ -1173,13 +2013,9 @@ def frame_change_handler(scene, depsgraph):
         log_message(f"⏸️ Skipping frame sync - in cooldown period ({remaining_cooldown:.2f}s remaining)")
         return
     
-    # Throttle updates to prevent excessive network traffic
-    if current_time - last_frame_sync_time >= frame_sync_throttle:
-        log_message(f"Animation frame changed to: {scene.frame_current}")
-        send_mesh_data()
-        last_frame_sync_time = current_time
-    else:
-        log_message(f"Frame change throttled (frame {scene.frame_current})")  
+    # No time gate: the sender thread paces itself and coalesces frames it can't keep up with
+    log_message(f"Animation frame changed to: {scene.frame_current}")
+    send_mesh_data()
 
 
 classes = (
@@ -1203,9 +2039,10 @@ def register():
 
 
 def unregister():
-    global is_server_running, tcp_socket, stop_receive_thread
+    global is_server_running, tcp_socket, stop_receive_thread, mesh_pack_pool
     is_server_running = False
     stop_receive_thread = True
+    stop_sender(tcp_socket)
     if tcp_socket:
         tcp_socket.close()
         tcp_socket = None
@@ -1214,6 +2051,11 @@ def unregister():
         bpy.app.handlers.depsgraph_update_post.remove(depsgraph_update_handler)
     if frame_change_handler in bpy.app.handlers.frame_change_post:
         bpy.app.handlers.frame_change_post.remove(frame_change_handler)
+    if bpy.app.timers.is_registered(drain_pending_sync):
+        bpy.app.timers.unregister(drain_pending_sync)
+    if mesh_pack_pool is not None:
+        mesh_pack_pool.shutdown(wait=False)
+        mesh_pack_pool = None
 
     for cls in reversed(classes):
         bpy.utils.unregister_class(cls)
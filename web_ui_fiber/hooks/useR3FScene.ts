@@ -35,6 +35,8 @@ export function useR3FScene(
   const sendMessageRef = useRef(sendMessage)
   
   const [meshes, setMeshes] = useState<R3FMeshData[]>([])
+  // Last applied transform per object; reused by reference while Blender's transformEpoch is unchanged
+  const transformCacheRef = useRef(new Map<string, { epoch: number; position: [number, number, number]; rotation: [number, number, number]; scale: [number, number, number] }>())
   const [selectedObject, setSelectedObject] = useState<THREE.Object3D | null>(null)
   const [isEditMode, setIsEditMode] = useState(false)
   const [isWireframe, setIsWireframe] = useState(false)
@@ -315,7 +317,13 @@ export function useR3FScene(
     let rotation: [number, number, number] = [0, 0, 0]
     let scale: [number, number, number] = [1, 1, 1]
 
-    if (objectData.transform) {
+    // Same epoch: same prop arrays, so R3F leaves the object (and any local drag) untouched
+    const cachedTransform = transformCacheRef.current.get(objectData.name)
+    if (cachedTransform && objectData.transformEpoch !== undefined && cachedTransform.epoch === objectData.transformEpoch) {
+      position = cachedTransform.position
+      rotation = cachedTransform.rotation
+      scale = cachedTransform.scale
+    } else if (objectData.transform) {
       const blenderMatrix = new THREE.Matrix4()
       blenderMatrix.fromArray(objectData.transform.flat())
       
@@ -343,6 +351,10 @@ export function useR3FScene(
       position = [threePosition.x, threePosition.y, threePosition.z]
       rotation = [euler.x, euler.y, euler.z]
       scale = [scaleVec.x, scaleVec.y, scaleVec.z]
+
+      if (objectData.transformEpoch !== undefined) {
+        transformCacheRef.current.set(objectData.name, { epoch: objectData.transformEpoch, position, rotation, scale })
+      }
     }
 
     return {
@@ -378,6 +390,12 @@ export function useR3FScene(
         return mesh
       })
 
+      // Forget transforms of objects removed in Blender
+      const objectNames = new Set(meshData.objects.map(objectData => objectData.name))
+      transformCacheRef.current.forEach((_, name) => {
+        if (!objectNames.has(name)) transformCacheRef.current.delete(name)
+      })
+
       if (meshData.lights) {
         const processedLights = meshData.lights.map(lightData => {
           if (!lightData || typeof lightData !== 'object') return null;
@@ -630,6 +648,8 @@ export function useR3FScene(
     // When dragging ends, send the final transform to Blender
     if (!isDraggingNow && selectedObject) {
       console.log('🏁 Dragging ended, sending final transform to Blender')
+      // The object now differs from Blender's matrix: take the next frame's transform even if its epoch is unchanged
+      transformCacheRef.current.delete(selectedObject.userData?.blenderName || selectedObject.name)
       sendFinalTransform()
     }
   }, [isDragging, selectedObject])
@@ -0,0 +1,139 @@
+import type { BlenderSceneData } from '@/types'
+
+// Object URLs for texture blobs, keyed by content hash so identical textures are reused.
+// Blender forgets which textures a client holds once a frame stops referencing them,
+// so URLs are revoked at the same point and the bytes are released.
+const textureUrlCache = new Map<string, string>() // hash -> blob: URL
+
+// Mesh arrays travel as raw little-endian buffers; the header holds a descriptor instead
+interface ArrayDescriptor {
+  offset: number
+  length: number
+  dtype: 'float32' | 'uint32'
+  shape: number[]
+}
+
+const MESH_ARRAY_FIELDS = ['vertices', 'faces', 'uvs'] as const
+
+// Geometry already received per object; frames mark unchanged geometry with reuseGeometry
+const geometryCache = new Map<string, { version: number; vertices: number[][]; faces: number[][]; uvs?: number[][] }>()
+
+function isArrayDescriptor(value: any): value is ArrayDescriptor {
+  return value != null && typeof value === 'object' && !Array.isArray(value) && 'dtype' in value
+}
+
+/**
+ * Rebuild the [row][column] arrays the scene code consumes from a typed view
+ * The binary section is 4-byte aligned by the plugin, so the view needs no copy
+ */
+function readArray(buffer: ArrayBuffer, blobStart: number, descriptor: ArrayDescriptor): number[][] {
+  const ArrayType = descriptor.dtype === 'uint32' ? Uint32Array : Float32Array
+  const flat = new ArrayType(buffer, blobStart + descriptor.offset, descriptor.length / ArrayType.BYTES_PER_ELEMENT)
+  const [rows, columns] = descriptor.shape
+  const result: number[][] = new Array(rows)
+  for (let i = 0; i < rows; i++) {
+    const row = new Array(columns)
+    for (let j = 0; j < columns; j++) {
+      row[j] = flat[i * columns + j]
+    }
+    result[i] = row
+  }
+  return result
+}
+
+/**
+ * Decode a binary scene frame sent by the Blender plugin
+ * Layout: [4 bytes JSON length, big-endian][JSON header][binary section]
+ * Mesh arrays are described as { offset, length, dtype, shape } into the binary section,
+ * or omitted with reuseGeometry when the geometryVersion was sent before;
+ * world matrices arrive as one (N, 4, 4) transforms buffer in object order;
+ * texture bytes are indexed as blobs: { hash: [offset, length] }
+ */
+export function decodeScenePayload(buffer: ArrayBuffer): BlenderSceneData {
+  const view = new DataView(buffer)
+  const headerLength = view.getUint32(0)
+  const header = JSON.parse(new TextDecoder().decode(new Uint8Array(buffer, 4, headerLength)))
+  const blobStart = 4 + headerLength
+  const blobs: { [hash: string]: [number, number] } = header.blobs || {}
+  delete header.blobs
+
+  header.objects = header.objects || []
+  if (isArrayDescriptor(header.transforms)) {
+    const transforms = header.transforms
+    const matrices = new Float32Array(buffer, blobStart + transforms.offset, transforms.length / Float32Array.BYTES_PER_ELEMENT)
+    header.objects.forEach((obj: any, index: number) => {
+      const transform: number[][] = new Array(4)
+      for (let row = 0; row < 4; row++) {
+        const start = index * 16 + row * 4
+        transform[row] = [matrices[start], matrices[start + 1], matrices[start + 2], matrices[start + 3]]
+      }
+      obj.transform = transform
+    })
+  }
+  delete header.transforms
+
+  const frameObjects = new Set<string>()
+  header.objects = header.objects.filter((obj: any) => {
+    frameObjects.add(obj.name)
+    if (obj.reuseGeometry) {
+      delete obj.reuseGeometry
+      const cached = geometryCache.get(obj.name)
+      if (!cached || cached.version !== obj.geometryVersion) {
+        // Frame sent before the full resync reached this client; the resync brings the arrays
+        console.warn(`📦 WIRE: No cached geometry for '${obj.name}' (version ${obj.geometryVersion}), skipping object`)
+        return false
+      }
+      obj.vertices = cached.vertices
+      obj.faces = cached.faces
+      obj.uvs = cached.uvs
+      return true
+    }
+
+    MESH_ARRAY_FIELDS.forEach(field => {
+      if (isArrayDescriptor(obj[field])) {
+        obj[field] = readArray(buffer, blobStart, obj[field])
+      }
+    })
+    if (obj.geometryVersion !== undefined) {
+      geometryCache.set(obj.name, { version: obj.geometryVersion, vertices: obj.vertices, faces: obj.faces, uvs: obj.uvs })
+    }
+    return true
+  })
+
+  // Objects missing from a frame were removed in Blender
+  geometryCache.forEach((_, name) => {
+    if (!frameObjects.has(name)) geometryCache.delete(name)
+  })
+
+  const frameTextures = new Set<string>()
+  header.objects.forEach((obj: any) => {
+    obj.materials?.forEach((mat: any) => {
+      if (!mat.textures) return
+      Object.values(mat.textures).forEach((texture: any) => {
+        if (!texture.hash) return
+        frameTextures.add(texture.hash)
+
+        let url = textureUrlCache.get(texture.hash)
+        if (!url && blobs[texture.hash]) {
+          const [offset, length] = blobs[texture.hash]
+          const bytes = new Uint8Array(buffer, blobStart + offset, length)
+          url = URL.createObjectURL(new Blob([bytes], { type: texture.mime || 'image/png' }))
+          textureUrlCache.set(texture.hash, url)
+        }
+        if (url) {
+          texture.data = url
+        }
+      })
+    })
+  })
+
+  // Textures missing from a frame are no longer used by any material
+  textureUrlCache.forEach((url, hash) => {
+    if (!frameTextures.has(hash)) {
+      URL.revokeObjectURL(url)
+      textureUrlCache.delete(hash)
+    }
+  })
+
+  return header
+}
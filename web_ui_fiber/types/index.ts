@@ -14,16 +14,18 @@ export interface BlenderMaterialData {
   textures?: {
     diffuse?: {
       name: string
-      data?: string // base64 data URL
+      data?: string // blob: URL built from the binary payload
+      mime?: string // MIME type of the raw texture bytes
       size?: number
       format?: string
-      hash?: string // MD5 hash for caching
+      hash?: string // Content hash for caching
       filepath?: string // fallback for debugging
       error?: string // if loading failed
     }
     normal?: {
       name: string
       data?: string
+      mime?: string
       size?: number
       format?: string
       hash?: string
@@ -33,6 +35,7 @@ export interface BlenderMaterialData {
     roughness?: {
       name: string
       data?: string
+      mime?: string
       size?: number
       format?: string
       hash?: string
@@ -42,6 +45,7 @@ export interface BlenderMaterialData {
     metalness?: {
       name: string
       data?: string
+      mime?: string
       size?: number
       format?: string
       hash?: string
@@ -51,6 +55,7 @@ export interface BlenderMaterialData {
     emission?: {
       name: string
       data?: string
+      mime?: string
       size?: number
       format?: string
       hash?: string
@@ -88,6 +93,8 @@ export interface BlenderObjectData {
   transform?: number[][]
   materials?: BlenderMaterialData[]
   materialIndices?: number[] // Per-face material indices
+  geometryVersion?: number // Changes whenever Blender re-extracts the mesh arrays
+  transformEpoch?: number // Changes only when the object's world matrix changes
 }
 
 export interface BlenderSceneData {
@@ -163,6 +163,8 @@ export function useThreeScene(sendMessage?: (message: any) => boolean) {
         // Send transform data to Blender when dragging ends
         if (!event.value && selectedObjectRef.current && sendTransformRef.current) {
           console.log('🔧 TransformControls: Dragging ended, sending transform to Blender')
+          // The mesh now differs from Blender's matrix: take the next frame's transform even if its epoch is unchanged
+          delete selectedObjectRef.current.userData.transformEpoch
           sendTransformRef.current(selectedObjectRef.current)
         }
       })
@@ -614,8 +616,10 @@ export function useThreeScene(sendMessage?: (message: any) => boolean) {
         mesh.material = materials.length === 1 ? materials[0] : materials
         console.log(`🔄 UPDATE: Applied ${materials.length} materials to '${objectData.name}'`)
         
-        // Update transform
-        if (objectData.transform) {
+        // Update transform, unless Blender reports the same matrix as last time
+        const transformChanged = objectData.transformEpoch === undefined || mesh.userData.transformEpoch !== objectData.transformEpoch
+        if (objectData.transform && transformChanged) {
+          mesh.userData.transformEpoch = objectData.transformEpoch
           const blenderMatrix = new THREE.Matrix4()
           blenderMatrix.fromArray(objectData.transform.flat())
           
@@ -666,6 +670,7 @@ export function useThreeScene(sendMessage?: (message: any) => boolean) {
         if (!mesh.userData) mesh.userData = {}
         mesh.userData.selectable = true
         mesh.userData.blenderName = objectData.name
+        mesh.userData.transformEpoch = objectData.transformEpoch
         currentMeshes.set(objectData.name, mesh)
         sceneRef.current?.add(mesh)
         console.log(`➕ NEW: Added mesh '${objectData.name}' to scene (selectable: ${mesh.userData.selectable})`)
@@ -2,6 +2,7 @@
 
 import { useEffect, useRef, useState, useCallback } from 'react'
 import type { BlenderMeshData, BlenderSceneData, ConnectionStatus } from '@/types'
+import { decodeScenePayload } from '@/lib/wire'
 
 export function useWebSocket() {
   const [connectionStatus, setConnectionStatus] = useState<ConnectionStatus>({
@@ -25,6 +26,7 @@ export function useWebSocket() {
       console.log(`Creating WebSocket connection to: ${wsUrl}`)
       
       const socket = new WebSocket(wsUrl)
+      socket.binaryType = 'arraybuffer' // Scene frames arrive as JSON header + binary blobs
       socketRef.current = socket
 
       socket.onopen = () => {
@@ -71,8 +73,9 @@ export function useWebSocket() {
 
       socket.onmessage = (event) => {
         try {
-          console.log(`📨 Received message from server (${event.data.length} bytes)`)
-          const data = JSON.parse(event.data)
+          const isBinary = event.data instanceof ArrayBuffer
+          console.log(`📨 Received message from server (${isBinary ? event.data.byteLength : event.data.length} bytes)`)
+          const data = isBinary ? decodeScenePayload(event.data) : JSON.parse(event.data)
           
           // Handle both legacy format (BlenderMeshData) and new format (BlenderSceneData)
           if (data.objects) {
@@ -109,7 +112,7 @@ export function useWebSocket() {
             setMeshData(data)
           }
         } catch (error) {
-          console.error('❌ WEBSOCKET: Error parsing message:', error, 'Raw data length:', event.data.length)
+          console.error('❌ WEBSOCKET: Error parsing message:', error, 'Raw data length:', event.data.byteLength ?? event.data.length)
         }
       }
       
@@ -143,7 +143,7 @@ export function createMaterialFromBlenderData(
             cacheStats.hits++
             console.log(`🎨 MATERIAL: Using cached ${type} texture '${texture.name}' (cache hit: ${cacheStats.hits}/${cacheStats.totalTextures})`)
           } else {
-            // Load new texture from base64 data URL
+            // Load new texture from the blob URL built by decodeScenePayload
             console.log(`🎨 MATERIAL: Loading new ${type} texture '${texture.name}' (${texture.format || 'unknown'} format)`)
             
             const threeTexture = textureLoader.load(
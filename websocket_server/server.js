@@ -22,7 +22,7 @@ let wsClients = new Set();
 
 // Transform update buffering and smoothing
 const transformBuffer = new Map(); // objectName -> latest transform data
-const transformTimers = new Map(); // objectName -> timer reference
+let transformFlushTimer = null; // single timer that flushes the whole buffer as one batch
 const TRANSFORM_SEND_RATE = process.env.TRANSFORM_RATE || 10; // Hz, configurable via env
 const TRANSFORM_SEND_INTERVAL = 1000 / TRANSFORM_SEND_RATE; // milliseconds
 
@@ -32,31 +32,92 @@ console.log(`🔧 Server transform buffering configured at ${TRANSFORM_SEND_RATE
 const tcpServer = net.createServer();
 let dataBuffer = Buffer.alloc(0);
 let expectedDataSize = null;
+let expectedCodec = null;
 let blenderSocket = null; // Keep reference to Blender connection
 
-// Function to send buffered transform to Blender
-function sendBufferedTransform(objectName) {
-    const transformData = transformBuffer.get(objectName);
-    if (!transformData) return;
+// Payload codec tags (5th header byte), must match the Blender plugin
+const CODEC_NONE = 0;
+const CODEC_ZLIB = 1;
+const CODEC_ZSTD = 2;
+// Codecs this Node.js build can inflate, announced to Blender when it connects
+const SUPPORTED_CODECS = typeof zlib.zstdDecompress === 'function'
+    ? [CODEC_NONE, CODEC_ZLIB, CODEC_ZSTD]
+    : [CODEC_NONE, CODEC_ZLIB];
+
+// Binary transform batch sent to Blender instead of JSON (JSON messages start with '{' or '[')
+// Layout: [1 byte type][2 bytes record count, LE] then one fixed-size record per object:
+// 64-byte UTF-8 name (zero padded), uint64 timestamp in ms, 9 float32 (position, rotation, scale)
+const MESSAGE_TRANSFORM_BATCH = 0x01;
+const TRANSFORM_NAME_BYTES = 64;
+const TRANSFORM_RECORD_SIZE = TRANSFORM_NAME_BYTES + 8 + 9 * 4;
+
+// Function to pack transform updates into a binary batch, or null when a record doesn't fit
+function encodeTransformBatch(batch) {
+    if (batch.length > 0xffff) return null;
+
+    const buffer = Buffer.alloc(3 + batch.length * TRANSFORM_RECORD_SIZE);
+    buffer.writeUInt8(MESSAGE_TRANSFORM_BATCH, 0);
+    buffer.writeUInt16LE(batch.length, 1);
+
+    let offset = 3;
+    for (const transformData of batch) {
+        const name = Buffer.from(transformData.objectName || '', 'utf8');
+        const values = [
+            ...(transformData.position || [0, 0, 0]),
+            ...(transformData.rotation || [0, 0, 0]),
+            ...(transformData.scale || [1, 1, 1])
+        ];
+        if (name.length > TRANSFORM_NAME_BYTES || values.length !== 9) return null;
+
+        name.copy(buffer, offset);
+        const timestamp = Math.max(0, Math.floor(Number(transformData.timestamp) || 0));
+        buffer.writeBigUInt64LE(BigInt(timestamp), offset + TRANSFORM_NAME_BYTES);
+        values.forEach((value, i) => {
+            buffer.writeFloatLE(Number(value), offset + TRANSFORM_NAME_BYTES + 8 + i * 4);
+        });
+        offset += TRANSFORM_RECORD_SIZE;
+    }
+    return buffer;
+}
+
+// Function to decompress a packet according to its codec tag
+function decompressPacket(codec, compressedData, callback) {
+    switch (codec) {
+        case CODEC_NONE:
+            callback(null, compressedData);
+            break;
+        case CODEC_ZLIB:
+            zlib.inflate(compressedData, callback);
+            break;
+        case CODEC_ZSTD:
+            if (typeof zlib.zstdDecompress === 'function') {
+                zlib.zstdDecompress(compressedData, callback);
+            } else {
+                callback(new Error('zstd payloads require Node.js with zlib zstd support'));
+            }
+            break;
+        default:
+            callback(new Error(`Unknown payload codec: ${codec}`));
+    }
+}
+
+// Function to send all buffered transforms to Blender as one JSON array
+function sendBufferedTransforms() {
+    transformFlushTimer = null;
+    if (transformBuffer.size === 0) return;
     
-    console.log(`📡 Sending buffered transform for '${objectName}' to Blender:`, {
-        position: transformData.position,
-        rotation: transformData.rotation,
-        scale: transformData.scale,
-        bufferedFor: `${Date.now() - transformData.firstReceived}ms`
-    });
+    const batch = Array.from(transformBuffer.values());
+    const now = Date.now();
+    console.log(`📡 Sending ${batch.length} buffered transforms to Blender:`, batch.map(transformData => ({
+        objectName: transformData.objectName,
+        bufferedFor: `${now - transformData.firstReceived}ms`
+    })));
     
-    const success = forwardToBlenderImmediate(transformData);
+    const success = forwardToBlenderImmediate(batch);
     
     if (success) {
-        // Clear the buffer and timer for this object
-        transformBuffer.delete(objectName);
-        const timer = transformTimers.get(objectName);
-        if (timer) {
-            clearTimeout(timer);
-            transformTimers.delete(objectName);
-        }
-        console.log(`✅ Buffered transform sent for '${objectName}', buffer cleared`);
+        transformBuffer.clear();
+        console.log(`✅ Buffered transforms sent, buffer cleared`);
     }
 }
 
@@ -75,19 +136,11 @@ function bufferTransformUpdate(message) {
     
     transformBuffer.set(objectName, transformData);
     
-    // Clear existing timer if any
-    const existingTimer = transformTimers.get(objectName);
-    if (existingTimer) {
-        clearTimeout(existingTimer);
+    // Arm the shared timer only if no flush is pending, so a continuous drag still flushes every interval
+    if (!transformFlushTimer) {
+        transformFlushTimer = setTimeout(sendBufferedTransforms, TRANSFORM_SEND_INTERVAL);
     }
     
-    // Set new timer to send the latest transform after the interval
-    const timer = setTimeout(() => {
-        sendBufferedTransform(objectName);
-    }, TRANSFORM_SEND_INTERVAL);
-    
-    transformTimers.set(objectName, timer);
-    
     console.log(`🔄 Buffered transform update for '${objectName}' (${TRANSFORM_SEND_RATE}Hz smoothing)`);
 }
 
@@ -95,19 +148,20 @@ function bufferTransformUpdate(message) {
 function forwardToBlenderImmediate(message) {
     if (blenderSocket && !blenderSocket.destroyed) {
         try {
-            const messageStr = JSON.stringify(message);
-            const messageBuffer = Buffer.from(messageStr, 'utf8');
+            // Transform batches use the fixed binary layout, everything else stays JSON
+            const messageBuffer = (Array.isArray(message) && encodeTransformBatch(message))
+                || Buffer.from(JSON.stringify(message), 'utf8');
             
             console.log(`📤 Preparing to send to Blender: ${messageBuffer.length} bytes`);
             
-            // Send message size first (4 bytes), then the message
+            // Message size (4 bytes) and message in one write, so no-delay mode sends one segment
             const sizeBuffer = Buffer.allocUnsafe(4);
             sizeBuffer.writeUInt32BE(messageBuffer.length, 0);
             
-            blenderSocket.write(sizeBuffer);
-            blenderSocket.write(messageBuffer);
+            blenderSocket.write(Buffer.concat([sizeBuffer, messageBuffer], 4 + messageBuffer.length));
             
-            console.log(`✅ Successfully sent transform update to Blender (${messageBuffer.length} bytes)`);
+            const description = Array.isArray(message) ? `${message.length} transform updates` : message.type;
+            console.log(`✅ Successfully sent ${description} to Blender (${messageBuffer.length} bytes)`);
             return true;
         } catch (error) {
             handleError(error, 'Forward to Blender');
@@ -129,14 +183,14 @@ function forwardToBlenderImmediate(message) {
 function flushAllTransforms() {
     console.log(`🧹 Flushing ${transformBuffer.size} pending transforms`);
     
-    // Clear all timers
-    for (const [objectName, timer] of transformTimers) {
-        clearTimeout(timer);
+    // Clear the flush timer
+    if (transformFlushTimer) {
+        clearTimeout(transformFlushTimer);
+        transformFlushTimer = null;
     }
     
     // Clear all data
     transformBuffer.clear();
-    transformTimers.clear();
     
     console.log('✅ All transform buffers cleared');
 }
@@ -157,6 +211,9 @@ tcpServer.on('connection', (socket) => {
     
     socket.setKeepAlive(true, 1000);
     socket.setNoDelay(true);
+    
+    // Let Blender pick the best payload codec we can decompress
+    forwardToBlenderImmediate({ type: 'hello', codecs: SUPPORTED_CODECS });
 
     socket.on('data', (data) => {
         try {
@@ -166,10 +223,11 @@ tcpServer.on('connection', (socket) => {
 
             // Process all complete packets in buffer
             while (dataBuffer.length > 0) {
-                // If data size hasn't been read yet
-                if (expectedDataSize === null && dataBuffer.length >= 4) {
+                // If data size hasn't been read yet (4 bytes size + 1 byte codec)
+                if (expectedDataSize === null && dataBuffer.length >= 5) {
                     expectedDataSize = dataBuffer.readUInt32BE(0);
-                    dataBuffer = dataBuffer.slice(4);
+                    expectedCodec = dataBuffer.readUInt8(4);
+                    dataBuffer = dataBuffer.slice(5);
                     
                     // Validate data size (prevent corruption attacks)
                     if (expectedDataSize > 50 * 1024 * 1024) { // 50MB max
@@ -177,19 +235,20 @@ tcpServer.on('connection', (socket) => {
                         // Reset and try to recover
                         dataBuffer = Buffer.alloc(0);
                         expectedDataSize = null;
+                        expectedCodec = null;
                         break;
                     }
-                    
-                    console.log(`📏 New packet header: expecting ${expectedDataSize} bytes`);
+
+                    console.log(`📏 New packet header: expecting ${expectedDataSize} bytes (codec ${expectedCodec})`);
                 }
 
                 // If we have complete data
                 if (expectedDataSize !== null && dataBuffer.length >= expectedDataSize) {
                     const compressedData = dataBuffer.slice(0, expectedDataSize);
                     console.log(`🗜️ Processing complete packet: ${compressedData.length} bytes`);
-                    
+
                     // Decompress data
-                    zlib.inflate(compressedData, (err, result) => {
+                    decompressPacket(expectedCodec, compressedData, (err, result) => {
                         if (err) {
                             console.error(`💥 Decompression failed for ${compressedData.length} bytes:`, err.message);
                             console.error(`🔍 First 20 bytes:`, compressedData.slice(0, 20));
@@ -199,12 +258,12 @@ tcpServer.on('connection', (socket) => {
 
                         console.log(`✅ Decompression successful: ${result.length} bytes original`);
 
-                        // Send to all WebSocket clients
-                        const data = result.toString();
+                        // Send to all WebSocket clients as a binary frame
+                        // (JSON header followed by raw texture blobs)
                         let clientCount = 0;
                         wsClients.forEach(client => {
                             if (client.readyState === WebSocket.OPEN) {
-                                client.send(data);
+                                client.send(result, { binary: true });
                                 clientCount++;
                             }
                         });
@@ -214,6 +273,7 @@ tcpServer.on('connection', (socket) => {
                     // Clean up buffer for next packet
                     dataBuffer = dataBuffer.slice(expectedDataSize);
                     expectedDataSize = null;
+                    expectedCodec = null;
                     console.log(`🔄 Buffer cleaned, remaining: ${dataBuffer.length} bytes`);
                 } else {
                     // Not enough data yet, wait for more
@@ -227,6 +287,7 @@ tcpServer.on('connection', (socket) => {
             // Reset buffer on any error to prevent cascade failures
             dataBuffer = Buffer.alloc(0);
             expectedDataSize = null;
+            expectedCodec = null;
         }
     });
 
@@ -251,6 +312,9 @@ wsServer.on('connection', (ws) => {
     wsClients.add(ws);
     console.log(`Current connected clients: ${wsClients.size}`);
 
+    // New clients hold no cached textures, ask Blender for a full scene including blobs
+    forwardToBlenderImmediate({ type: 'resync_request' });
+
     // Handle incoming messages from clients (e.g., transform updates)
     ws.on('message', (data) => {
         try {